@@ -4,29 +4,11 @@ MongoDB Models (Schemas) with Pydantic Validation
 Defines the document structures and validation for all MongoDB collections.
 """
 
-from datetime import datetime
-from typing import List, Optional
+import functools
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
 from pydantic import BaseModel, EmailStr, Field, validator
 from bson import ObjectId
-from pymongo import MongoClient
-from bson.objectid import ObjectId
-
-class MongoDB:
-    def __init__(self, uri="mongodb://localhost:27017", db_name="recruitment_db"):
-        self.client = MongoClient(uri)
-        self.db = self.client[db_name]
-
-    def insert_user(self, user_data):
-        return self.db.users.insert_one(user_data).inserted_id
-
-    def find_user(self, query):
-        return self.db.users.find_one(query)
-
-    def update_user(self, user_id, update_data):
-        return self.db.users.update_one({"_id": ObjectId(user_id)}, {"$set": update_data})
-
-    def delete_user(self, user_id):
-        return self.db.users.delete_one({"_id": ObjectId(user_id)})
 
 # Import settings (adjust path if needed)
 try:
@@ -34,6 +16,10 @@ try:
 except ImportError:
     from ..utils.config import settings
 
+def _now() -> datetime:
+    """Timezone-aware UTC timestamp used for model defaults"""
+    return datetime.now(timezone.utc)
+
 class PyObjectId(str):
     """Custom type for MongoDB ObjectId with Pydantic compatibility"""
     
@@ -43,9 +29,17 @@ class PyObjectId(str):
 
     @classmethod
     def validate(cls, v):
+        if isinstance(v, ObjectId):
+            return str(v)  # Return as string to avoid BSON serialization issues
+        return cls._validate_str(str(v))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _validate_str(v: str) -> str:
+        """Validate a hex id string, memoized for ids seen repeatedly"""
         if not ObjectId.is_valid(v):
             raise ValueError("Invalid ObjectId")
-        return str(v)  # Return as string to avoid BSON serialization issues
+        return v
 
     @classmethod
     def __modify_schema__(cls, field_schema):
@@ -62,7 +56,7 @@ class ModelBase(BaseModel):
 # ----- User Models -----
 class UserBase(ModelBase):
     email: EmailStr
-    role: str = Field(..., regex="^(candidate|recruiter|admin)$")
+    role: Literal["candidate", "recruiter", "admin"]
     first_name: Optional[str] = Field(None, max_length=50)
     last_name: Optional[str] = Field(None, max_length=50)
 
@@ -79,15 +73,22 @@ class UserInDB(UserBase):
     id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
     password_hash: str
     is_active: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
     login_attempts: int = 0
 
+class UserAuth(ModelBase):
+    """Credential fields answered from the users email_covered index"""
+    email: EmailStr
+    password_hash: str
+    role: str
+    is_active: bool = True
+
 # ----- Job Models -----
 class JobSkill(ModelBase):
     name: str = Field(..., max_length=100)
     category: Optional[str] = Field(None, max_length=50)
-    proficiency: Optional[str] = Field(None, regex="^(basic|intermediate|advanced|expert)$")
+    proficiency: Optional[Literal["basic", "intermediate", "advanced", "expert"]] = None
 
 class JobBase(ModelBase):
     title: str = Field(..., max_length=100)
@@ -104,9 +105,9 @@ class JobCreate(JobBase):
 class JobInDB(JobBase):
     id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
     creator_id: PyObjectId
-    status: str = Field("pending", regex="^(pending|approved|rejected|closed)$")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    status: Literal["pending", "approved", "rejected", "closed"] = "pending"
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
     approved_at: Optional[datetime] = None
     approved_by: Optional[PyObjectId] = None
 
@@ -123,9 +124,9 @@ class ApplicationCreate(ApplicationBase):
 class ApplicationInDB(ApplicationBase):
     id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
     match_score: float = Field(0.0, ge=0, le=100)
-    status: str = Field("applied", regex="^(applied|reviewed|interviewed|rejected|hired)$")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    status: Literal["applied", "reviewed", "interviewed", "rejected", "hired"] = "applied"
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
 
 # ----- Interview Models -----
 class InterviewQuestion(ModelBase):
@@ -153,8 +154,8 @@ class InterviewInDB(InterviewBase):
     answers: List[InterviewAnswer] = []
     score: int = Field(0, ge=0)
     total_questions: int = Field(0, ge=0)
-    status: str = Field("pending", regex="^(pending|completed|reviewed)$")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    status: Literal["pending", "completed", "reviewed"] = "pending"
+    created_at: datetime = Field(default_factory=_now)
     completed_at: Optional[datetime] = None
 
 # ----- Activity Log Model -----
@@ -163,7 +164,7 @@ class ActivityLog(ModelBase):
     action: str
     entity_type: Optional[str]  # e.g., "job", "application"
     entity_id: Optional[PyObjectId]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now)
 
 # ----- Resume Parser Model -----
 class ParsedResume(ModelBase):
@@ -172,12 +173,12 @@ class ParsedResume(ModelBase):
     skills: List[str] = []
     experience_years: float = 0.0
     education: List[str] = []
-    parsed_at: datetime = Field(default_factory=datetime.utcnow)
+    parsed_at: datetime = Field(default_factory=_now)
 
 # Export all models
 __all__ = [
     # Users
-    "UserBase", "UserCreate", "UserInDB",
+    "UserBase", "UserCreate", "UserInDB", "UserAuth",
     
     # Jobs
     "JobSkill", "JobBase", "JobCreate", "JobInDB",
@@ -193,9 +194,3 @@ __all__ = [
     "ActivityLog", "ParsedResume",
     "PyObjectId"  # Custom ObjectId type
 ]
-
-if __name__ == "__main__":
-    db = MongoDB()
-    new_user = {"name": "John Doe", "email": "john@example.com"}
-    user_id = db.insert_user(new_user)
-    print(f"Inserted User ID: {user_id}")
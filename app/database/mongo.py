@@ -3,28 +3,40 @@ Enhanced MongoDB Service with Connection Recovery and Data Access Layer
 
 Handles all database operations with:
 - Automatic connection recovery
-- Exponential backoff retry logic
-- Type validation against Pydantic models
+- Exponential backoff retry logic for connecting and index creation
+  (transient errors on reads/writes are retried by the driver via
+  retryReads/retryWrites)
+- Type validation against Pydantic models on writes (reads trust stored
+  documents and skip validation via Model.construct)
 - Comprehensive error handling
 - Index management
+
+Pydantic models are imported lazily inside the methods that need them so
+importing this module stays cheap.
 """
 
-from typing import Optional, List, Dict, Any, TypeVar, Type
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, TypeVar, Type, AsyncIterator, Iterator, Union, TYPE_CHECKING
 from pydantic import BaseModel
-from pymongo import MongoClient, ReturnDocument
+from pymongo import MongoClient, ReturnDocument, IndexModel, ASCENDING, DESCENDING, monitoring
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import (
     ConnectionFailure,
     OperationFailure,
     DuplicateKeyError,
     PyMongoError,
-    ServerSelectionTimeoutError,
-    NetworkTimeout,
-    AutoReconnect
+    ServerSelectionTimeoutError
 )
 from bson import ObjectId
+from bson.codec_options import CodecOptions
 from bson.errors import InvalidId
+import asyncio
 import logging
-from datetime import datetime
+import random
+import threading
+from datetime import datetime, timezone
 import time
 from tenacity import (
     retry,
@@ -34,10 +46,12 @@ from tenacity import (
     before_sleep_log
 )
 from app.utils.config import settings
-from app.models import (
-    UserInDB, JobInDB, ApplicationInDB,
-    InterviewInDB, ActivityLog, PyObjectId
-)
+
+if TYPE_CHECKING:
+    from app.database.models import (
+        UserInDB, UserAuth, JobInDB, ApplicationInDB,
+        InterviewInDB, ActivityLog, PyObjectId
+    )
 from dotenv import load_dotenv
 import os
 
@@ -49,72 +63,207 @@ DATABASE_NAME = os.getenv("DATABASE_NAME")
 logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
+def _to_bson(document: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Serialize a model for insertion. None fields are omitted and an empty
+    _id is dropped so MongoDB assigns a native ObjectId. Plain dicts are
+    passed through unchanged.
+    """
+    if isinstance(document, dict):
+        return document
+    data = document.dict(by_alias=True, exclude_none=True)
+    if not data.get("_id"):
+        data.pop("_id", None)
+    return data
+
+class PoolEventLogger(monitoring.ConnectionPoolListener):
+    """
+    Debug-logs connection pool activity. Enabled with MONGO_LOG_POOL_EVENTS
+    to check that requests reuse warm connections instead of opening new ones.
+    """
+
+    def pool_created(self, event):
+        logger.debug(f"Pool created for {event.address}: {event.options}")
+
+    def pool_ready(self, event):
+        logger.debug(f"Pool ready for {event.address}")
+
+    def pool_cleared(self, event):
+        logger.debug(f"Pool cleared for {event.address}")
+
+    def pool_closed(self, event):
+        logger.debug(f"Pool closed for {event.address}")
+
+    def connection_created(self, event):
+        logger.debug(f"Connection {event.connection_id} created to {event.address}")
+
+    def connection_ready(self, event):
+        logger.debug(f"Connection {event.connection_id} ready on {event.address}")
+
+    def connection_closed(self, event):
+        logger.debug(f"Connection {event.connection_id} closed on {event.address}: {event.reason}")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        logger.debug(f"Connection check out failed on {event.address}: {event.reason}")
+
+    def connection_checked_out(self, event):
+        logger.debug(f"Connection {event.connection_id} checked out from {event.address}")
+
+    def connection_checked_in(self, event):
+        logger.debug(f"Connection {event.connection_id} checked in to {event.address}")
+
 class MongoDB:
-    _instance = None
     _connection_attempts = 0
-    MAX_RECONNECT_ATTEMPTS = 5
-    RECONNECT_DELAY = 2  # seconds
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
-    
-    def _initialize(self):
-        """Initialize MongoDB connection with retry logic"""
-        self.client: Optional[MongoClient] = None
-        self.db = None
+    RECONNECT_DELAY = 0.5  # seconds, doubled per attempt
+    MAX_RECONNECT_DELAY = 30  # seconds
+    RECONNECT_JITTER = 0.25  # seconds
+    ACTIVITY_FLUSH_SIZE = 100
+    ACTIVITY_FLUSH_INTERVAL = 1.0  # seconds
+    CODEC_OPTIONS = CodecOptions(tz_aware=True, tzinfo=timezone.utc)
+
+    INDEXES = {
+        "users": [
+            IndexModel([("email", ASCENDING)], unique=True, background=True),
+            # Serves admin filtering by role and/or active status
+            IndexModel([("role", ASCENDING), ("is_active", ASCENDING)], background=True),
+            # Covers get_user_auth_by_email so it never reads the document
+            IndexModel(
+                [("email", ASCENDING), ("password_hash", ASCENDING),
+                 ("role", ASCENDING), ("is_active", ASCENDING)],
+                name="email_covered",
+                background=True
+            ),
+        ],
+        "jobs": [
+            # Pending-jobs listing filters on status and sorts newest first
+            IndexModel([("status", ASCENDING), ("created_at", DESCENDING)], background=True),
+            IndexModel([("creator_id", ASCENDING)], background=True),
+            IndexModel([("department", ASCENDING)], background=True),
+        ],
+        "applications": [
+            IndexModel([("job_id", ASCENDING)], background=True),
+            IndexModel([("candidate_id", ASCENDING)], background=True),
+            IndexModel([("status", ASCENDING)], background=True),
+        ],
+        "interviews": [
+            IndexModel([("application_id", ASCENDING)], background=True),
+        ],
+        "activity_logs": [
+            IndexModel([("timestamp", DESCENDING)], background=True),
+            IndexModel([("timestamp", ASCENDING), ("category", ASCENDING)], background=True),
+            # Last activity per user
+            IndexModel([("user_email", ASCENDING), ("timestamp", DESCENDING)], background=True),
+        ],
+    }
+
+    def __init__(self):
+        """
+        Initialize MongoDB connection with retry logic.
+
+        Only the Motor client is opened, so the process has a single
+        connection pool; awaiting a query yields to the event loop. One-off
+        scripts that need blocking access use sync_mongodb() instead.
+        """
+        self.async_client: Optional[AsyncIOMotorClient] = None
+        self.async_db: Optional[AsyncIOMotorDatabase] = None
+        self._collections: Dict[str, Any] = {}
+        self._activity_queue: Optional[asyncio.Queue] = None
+        self._activity_flusher: Optional[asyncio.Task] = None
+        # Entries the flusher has taken off the queue but not yet written,
+        # and the write currently in flight
+        self._activity_batch: List[Any] = []
+        self._activity_write: Optional[asyncio.Task] = None
         self._connect()
-        self._ensure_indexes()
+
+    @staticmethod
+    def _client_options() -> Dict[str, Any]:
+        """Connection options shared by every client in the application"""
+        options = dict(
+            connectTimeoutMS=5000,
+            socketTimeoutMS=30000,
+            serverSelectionTimeoutMS=settings.MONGO_TIMEOUT_MS,
+            retryWrites=True,
+            retryReads=True,
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            appname="recruitment-system",
+            heartbeatFrequencyMS=settings.MONGO_HEARTBEAT_FREQUENCY_MS,
+            compressors=settings.MONGO_COMPRESSORS
+        )
+        if settings.MONGO_LOG_POOL_EVENTS:
+            options["event_listeners"] = [PoolEventLogger()]
+        return options
 
     def _connect(self):
         """Establish MongoDB connection with advanced retry logic"""
-        for attempt in range(1, self.MAX_RECONNECT_ATTEMPTS + 1):
+        max_attempts = settings.MONGO_CONNECT_ATTEMPTS
+        for attempt in range(1, max_attempts + 1):
             try:
-                self.client = MongoClient(
-                    settings.MONGO_URI,
-                    connectTimeoutMS=5000,
-                    socketTimeoutMS=30000,
-                    serverSelectionTimeoutMS=5000,
-                    retryWrites=True,
-                    retryReads=True,
-                    appname="recruitment-system",
-                    heartbeatFrequencyMS=10000,
-                    socketKeepAlive=True
-                )
+                self.async_client = AsyncIOMotorClient(settings.MONGO_URI, **self._client_options())
                 
-                # Force connection check
-                self.client.admin.command('ping')
-                self.db = self.client[settings.MONGO_DB_NAME]
+                # Force connection check through the client Motor wraps, so
+                # the blocking ping shares its pool instead of opening another
+                self.async_client.delegate.admin.command('ping')
+                self.async_db = self.async_client[settings.MONGO_DB_NAME]
+                self._collections = {}
                 self._connection_attempts = 0
                 logger.info("MongoDB connection established successfully")
                 return
                 
             except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+                if self.async_client is not None:
+                    self.async_client.close()
+                    self.async_client = None
                 self._connection_attempts += 1
                 logger.warning(f"MongoDB connection attempt {attempt} failed: {str(e)}")
-                if attempt == self.MAX_RECONNECT_ATTEMPTS:
+                if attempt == max_attempts:
                     logger.error("Max connection attempts reached")
                     raise
-                time.sleep(self.RECONNECT_DELAY * attempt)
+                # Jitter keeps processes that started together from retrying in lockstep
+                time.sleep(
+                    min(self.MAX_RECONNECT_DELAY, self.RECONNECT_DELAY * 2 ** (attempt - 1))
+                    + random.uniform(0, self.RECONNECT_JITTER)
+                )
                 
             except Exception as e:
                 logger.error(f"Unexpected MongoDB connection error: {str(e)}")
                 raise
 
     def _ensure_connection(self):
-        """Ensure we have an active connection"""
-        try:
-            if not self.client or not self.db:
-                raise ConnectionFailure("No active connection")
-            self.client.admin.command('ping')
-        except (ConnectionFailure, OperationFailure):
-            logger.warning("MongoDB connection lost, attempting to reconnect...")
+        """
+        Ensure a client exists. Server health is tracked by the driver's
+        heartbeat monitor, so no per-operation ping is issued here.
+        """
+        if self.async_client is None or self.async_db is None:
+            logger.warning("MongoDB connection missing, attempting to reconnect...")
             self._connect()
 
-    def _ensure_indexes(self):
-        """Ensure required indexes exist with retry logic"""
+    def _collection(self, name: str):
+        """
+        Return a cached Motor collection handle. Handles share CODEC_OPTIONS,
+        so dates come back as aware UTC datetimes matching the models.
+        """
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self.async_db.get_collection(name, codec_options=self.CODEC_OPTIONS)
+            self._collections[name] = collection
+        return collection
+
+    @classmethod
+    def ensure_indexes(cls, db):
+        """
+        Ensure required indexes exist with retry logic.
+
+        Not called on connect; run scripts/create_indexes.py at deploy time.
+
+        Args:
+            db: Blocking pymongo database, e.g. from sync_mongodb()
+        """
         @retry(
             stop=stop_after_attempt(3),
             wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -123,25 +272,9 @@ class MongoDB:
         )
         def create_indexes():
             try:
-                # Users collection
-                self.db.users.create_index([("email", 1)], unique=True, background=True)
-                self.db.users.create_index([("role", 1)], background=True)
-                
-                # Jobs collection
-                self.db.jobs.create_index([("status", 1)], background=True)
-                self.db.jobs.create_index([("creator_id", 1)], background=True)
-                self.db.jobs.create_index([("department", 1)], background=True)
-                
-                # Applications collection
-                self.db.applications.create_index([("job_id", 1)], background=True)
-                self.db.applications.create_index([("candidate_id", 1)], background=True)
-                self.db.applications.create_index([("status", 1)], background=True)
-                
-                # Interviews collection
-                self.db.interviews.create_index([("application_id", 1)], background=True)
-                
-                # Activity logs
-                self.db.activity_logs.create_index([("timestamp", -1)], background=True)
+                # One createIndexes command per collection
+                for collection, indexes in cls.INDEXES.items():
+                    db[collection].create_indexes(indexes)
                 
             except OperationFailure as e:
                 logger.error(f"Index creation failed: {str(e)}")
@@ -151,9 +284,9 @@ class MongoDB:
 
     def close(self):
         """Close MongoDB connection"""
-        if self.client:
+        if self.async_client:
             try:
-                self.client.close()
+                self.async_client.close()
                 logger.info("MongoDB connection closed")
             except Exception as e:
                 logger.error(f"Error closing MongoDB connection: {str(e)}")
@@ -169,24 +302,18 @@ class MongoDB:
         def _ping():
             try:
                 self._ensure_connection()
-                return self.client.admin.command('ping').get('ok', 0) == 1
+                return self.async_client.delegate.admin.command('ping').get('ok', 0) == 1
             except Exception as e:
                 logger.warning(f"Ping failed: {str(e)}")
                 return False
                 
         return _ping()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((AutoReconnect, NetworkTimeout)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
     async def insert_document(self, collection: str, document: BaseModel) -> Optional[PyObjectId]:
         """Insert document with connection recovery"""
         try:
             self._ensure_connection()
-            result = self.db[collection].insert_one(document.dict(by_alias=True))
+            result = await self._collection(collection).insert_one(_to_bson(document))
             return result.inserted_id
         except DuplicateKeyError as e:
             logger.error(f"Duplicate key error: {str(e)}")
@@ -195,30 +322,37 @@ class MongoDB:
             logger.error(f"Insert failed: {str(e)}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((AutoReconnect, NetworkTimeout)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    async def insert_documents(
+        self,
+        collection: str,
+        documents: List[Union[BaseModel, Dict[str, Any]]]
+    ) -> List[PyObjectId]:
+        """Insert many documents in a single unordered bulk write"""
+        if not documents:
+            return []
+        try:
+            self._ensure_connection()
+            result = await self._collection(collection).insert_many(
+                [_to_bson(document) for document in documents],
+                ordered=False
+            )
+            return result.inserted_ids
+        except PyMongoError as e:
+            logger.error(f"Bulk insert failed: {str(e)}")
+            raise
+
     async def get_document(self, collection: str, model: Type[T], **filters) -> Optional[T]:
         """
         Get a single document with model validation
         """
         try:
             self._ensure_connection()
-            doc = self.db[collection].find_one(filters)
-            return model(**doc) if doc else None
+            doc = await self._collection(collection).find_one(filters)
+            return model.construct(**doc) if doc else None
         except PyMongoError as e:
             logger.error(f"Query failed: {str(e)}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((AutoReconnect, NetworkTimeout)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
     async def get_documents(
         self,
         collection: str,
@@ -226,36 +360,71 @@ class MongoDB:
         filter: Optional[Dict] = None,
         skip: int = 0,
         limit: int = 100,
-        sort: Optional[List[tuple]] = None
+        sort: Optional[List[tuple]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        batch_size: int = 200
     ) -> List[T]:
         """
-        Get multiple documents with pagination and sorting
+        Get multiple documents with pagination, sorting and optional projection
         """
         try:
-            self._ensure_connection()
-            filter = filter or {}
-            cursor = self.db[collection].find(filter)
-            
-            if sort:
-                cursor = cursor.sort(sort)
-                
-            if skip:
-                cursor = cursor.skip(skip)
-                
-            if limit:
-                cursor = cursor.limit(limit)
-                
-            return [model(**doc) for doc in cursor]
+            cursor = self._find(collection, filter, skip, limit, sort, projection, batch_size)
+            return [model.construct(**doc) async for doc in cursor]
         except PyMongoError as e:
             logger.error(f"Query failed: {str(e)}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((AutoReconnect, NetworkTimeout)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    async def iter_documents(
+        self,
+        collection: str,
+        model: Type[T],
+        filter: Optional[Dict] = None,
+        skip: int = 0,
+        limit: int = 0,
+        sort: Optional[List[tuple]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        batch_size: int = 200
+    ) -> AsyncIterator[T]:
+        """
+        Stream documents one batch at a time instead of materializing a list
+        """
+        cursor = self._find(collection, filter, skip, limit, sort, projection, batch_size)
+        try:
+            async for doc in cursor:
+                yield model.construct(**doc)
+        except PyMongoError as e:
+            logger.error(f"Query failed: {str(e)}")
+            raise
+
+    def _find(
+        self,
+        collection: str,
+        filter: Optional[Dict],
+        skip: int,
+        limit: int,
+        sort: Optional[List[tuple]],
+        projection: Optional[Dict[str, Any]],
+        batch_size: int
+    ):
+        """Build a Motor cursor for the given query options"""
+        self._ensure_connection()
+        cursor = self._collection(collection).find(
+            filter or {},
+            projection=projection,
+            batch_size=batch_size
+        )
+        
+        if sort:
+            cursor = cursor.sort(sort)
+            
+        if skip:
+            cursor = cursor.skip(skip)
+            
+        if limit:
+            cursor = cursor.limit(limit)
+            
+        return cursor
+
     async def update_document(
         self,
         collection: str,
@@ -272,33 +441,27 @@ class MongoDB:
             update_op = {"$set": update_data}
             
             if return_updated:
-                result = self.db[collection].find_one_and_update(
+                result = await self._collection(collection).find_one_and_update(
                     filters,
                     update_op,
                     return_document=ReturnDocument.AFTER
                 )
-                return model(**result) if result else None
+                return model.construct(**result) if result else None
             else:
-                result = self.db[collection].update_many(filters, update_op)
+                result = await self._collection(collection).update_many(filters, update_op)
                 return result.modified_count
                 
         except PyMongoError as e:
             logger.error(f"Update failed: {str(e)}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((AutoReconnect, NetworkTimeout)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
     async def delete_document(self, collection: str, **filters) -> int:
         """
         Delete document(s) and return count of deleted items
         """
         try:
             self._ensure_connection()
-            result = self.db[collection].delete_many(filters)
+            result = await self._collection(collection).delete_many(filters)
             return result.deleted_count
         except PyMongoError as e:
             logger.error(f"Delete failed: {str(e)}")
@@ -307,8 +470,26 @@ class MongoDB:
     # ----- User Operations -----
     async def get_user_by_email(self, email: str) -> Optional[UserInDB]:
         """Get user by email with validation"""
+        from app.database.models import UserInDB
         return await self.get_document("users", UserInDB, email=email)
 
+    async def get_user_auth_by_email(self, email: str) -> Optional[UserAuth]:
+        """
+        Get only the credential fields for a user. The projection matches the
+        email_covered index (and excludes _id), so the query is index-only.
+        """
+        from app.database.models import UserAuth
+        try:
+            self._ensure_connection()
+            doc = await self._collection("users").find_one(
+                {"email": email},
+                projection={"_id": 0, "email": 1, "password_hash": 1, "role": 1, "is_active": 1}
+            )
+            return UserAuth.construct(**doc) if doc else None
+        except PyMongoError as e:
+            logger.error(f"Query failed: {str(e)}")
+            raise
+
     async def create_user(self, user: UserInDB) -> bool:
         """Create new user with validation"""
         result = await self.insert_document("users", user)
@@ -316,6 +497,7 @@ class MongoDB:
 
     async def update_user(self, user_id: str, update_data: Dict[str, Any]) -> Optional[UserInDB]:
         """Update user and return updated document"""
+        from app.database.models import UserInDB, PyObjectId
         try:
             filters = {"_id": PyObjectId.validate(user_id)}
             return await self.update_document(
@@ -335,6 +517,7 @@ class MongoDB:
 
     async def get_job_by_id(self, job_id: str) -> Optional[JobInDB]:
         """Get job by ID with validation"""
+        from app.database.models import JobInDB, PyObjectId
         try:
             return await self.get_document("jobs", JobInDB, _id=PyObjectId.validate(job_id))
         except InvalidId:
@@ -348,6 +531,7 @@ class MongoDB:
         limit: int = 100
     ) -> List[JobInDB]:
         """Get jobs with optional filtering"""
+        from app.database.models import JobInDB
         filters = {}
         if status:
             filters["status"] = status
@@ -370,6 +554,7 @@ class MongoDB:
 
     async def get_application_by_id(self, application_id: str) -> Optional[ApplicationInDB]:
         """Get application by ID"""
+        from app.database.models import ApplicationInDB, PyObjectId
         try:
             return await self.get_document(
                 "applications",
@@ -385,10 +570,67 @@ class MongoDB:
         return await self.insert_document("interviews", interview)
 
     # ----- Activity Logging -----
-    async def log_activity(self, activity: ActivityLog) -> bool:
-        """Log system activity"""
-        result = await self.insert_document("activity_logs", activity)
-        return result is not None
+    async def log_activity(self, activity: Union[ActivityLog, Dict[str, Any]]) -> bool:
+        """
+        Queue system activity for logging.
+
+        Entries are written in batches by a background task, every
+        ACTIVITY_FLUSH_SIZE entries or ACTIVITY_FLUSH_INTERVAL seconds.
+        Entries still queued when the process dies are lost; call
+        flush_activity_logs() before a clean shutdown.
+        """
+        if self._activity_flusher is None or self._activity_flusher.done():
+            self._activity_queue = asyncio.Queue()
+            self._activity_flusher = asyncio.create_task(self._flush_activity_logs())
+        await self._activity_queue.put(activity)
+        return True
+
+    async def _flush_activity_logs(self):
+        """Background task writing queued activity logs in bulk"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._activity_batch = [await self._activity_queue.get()]
+            deadline = loop.time() + self.ACTIVITY_FLUSH_INTERVAL
+            while len(batch) < self.ACTIVITY_FLUSH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._activity_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # The write is shielded so cancelling the flusher never abandons
+            # a half-sent batch; flush_activity_logs waits for it instead
+            self._activity_batch = []
+            self._activity_write = asyncio.ensure_future(self._write_activity_logs(batch))
+            await asyncio.shield(self._activity_write)
+
+    async def _write_activity_logs(self, batch: List[Any]):
+        try:
+            await self.insert_documents("activity_logs", batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} activity logs: {str(e)}")
+
+    async def flush_activity_logs(self):
+        """Stop the background flusher and write every pending activity log (e.g. on shutdown)"""
+        flusher, self._activity_flusher = self._activity_flusher, None
+        if flusher is not None and not flusher.done():
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        
+        if self._activity_write is not None:
+            await self._activity_write
+            self._activity_write = None
+        
+        batch, self._activity_batch = self._activity_batch, []
+        if self._activity_queue is not None:
+            while not self._activity_queue.empty():
+                batch.append(self._activity_queue.get_nowait())
+        if batch:
+            await self._write_activity_logs(batch)
 
     async def get_activity_logs(
         self,
@@ -398,6 +640,7 @@ class MongoDB:
         limit: int = 100
     ) -> List[ActivityLog]:
         """Get activity logs with optional filtering"""
+        from app.database.models import ActivityLog, PyObjectId
         filters = {}
         if user_id:
             try:
@@ -418,13 +661,47 @@ class MongoDB:
 
     # ----- Utility Methods -----
     def get_collection(self, collection_name: str):
-        """Get raw MongoDB collection reference"""
+        """Get raw (Motor) MongoDB collection reference"""
         self._ensure_connection()
-        return self.db[collection_name]
+        return self._collection(collection_name)
 
-# Singleton instance
-mongodb = MongoDB()
+# Lazily created singleton - nothing connects until the first get_mongodb() call
+_mongodb: Optional[MongoDB] = None
+_mongodb_lock = threading.Lock()
 
 def get_mongodb() -> MongoDB:
-    """Dependency function for FastAPI (if used)"""
-    return mongodb
\ No newline at end of file
+    """Return the shared MongoDB instance (also usable as a FastAPI dependency)"""
+    global _mongodb
+    if _mongodb is None:
+        with _mongodb_lock:
+            if _mongodb is None:
+                _mongodb = MongoDB()
+    return _mongodb
+
+def close_mongodb():
+    """Close the shared MongoDB connection if one was ever opened"""
+    global _mongodb
+    with _mongodb_lock:
+        if _mongodb is not None:
+            _mongodb.close()
+            _mongodb = None
+
+@contextmanager
+def sync_mongodb() -> Iterator[Any]:
+    """
+    Blocking pymongo database for one-off scripts (index creation,
+    migrations). The application itself only uses the Motor client.
+    """
+    options = MongoDB._client_options()
+    options["minPoolSize"] = 0
+    client = MongoClient(settings.MONGO_URI, **options)
+    try:
+        yield client[settings.MONGO_DB_NAME]
+    finally:
+        client.close()
+
+async def shutdown_mongodb():
+    """Write pending activity logs, then close the shared connection"""
+    if _mongodb is not None:
+        await _mongodb.flush_activity_logs()
+    close_mongodb()
\ No newline at end of file
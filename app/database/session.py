@@ -1,8 +1,8 @@
-import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
-from pymongo import MongoClient
+from app.database.mongo import close_mongodb
 from app.utils.config import config
 import logging
 
@@ -22,64 +22,44 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-# MongoDB Setup
-class MongoDB:
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            try:
-                cls._instance.client = MongoClient(
-                    config.MONGO_URI,
-                    connectTimeoutMS=30000,
-                    socketTimeoutMS=None,
-                    socketKeepAlive=True
-                )
-                cls._instance.db = cls._instance.client[config.MONGO_DB_NAME]
-                logger.info("Connected to MongoDB successfully")
-            except Exception as e:
-                logger.error(f"Failed to connect to MongoDB: {e}")
-                raise
-        return cls._instance
-
-# Database session dependency
-def get_db():
-    """
-    SQL Database session generator for FastAPI dependency injection
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        logger.error(f"Database session error: {e}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
-
 # Global database session instances
 db_session = scoped_session(SessionLocal)
-mongo = MongoDB().db
+
+# Async driver for each supported dialect, replacing any sync driver named
+# in DATABASE_URL (e.g. mysql+mysqldb, postgresql+psycopg2)
+_ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+def _async_database_url(url: str) -> str:
+    """The same database, reached through its asyncio driver"""
+    scheme, rest = url.split("://", 1)
+    dialect = scheme.split("+", 1)[0]
+    if dialect in _ASYNC_DRIVERS:
+        return f"{_ASYNC_DRIVERS[dialect]}://{rest}"
+    return url
+
+# Non-blocking engine for services that run on the event loop
+async_engine = create_async_engine(
+    _async_database_url(SQLALCHEMY_DATABASE_URL),
+    pool_size=20,
+    max_overflow=30,
+    pool_pre_ping=True,
+    pool_recycle=3600
+)
+
+# Objects stay readable after commit, once the session has closed
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 def init_db():
     """
-    Initialize database tables and indexes
+    Initialize database tables
     """
     try:
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
-        
-        # Create MongoDB indexes
-        mongo.users.create_index("email", unique=True)
-        mongo.jobs.create_index("creator_email")
-        mongo.jobs.create_index("status")
-        mongo.applications.create_index("job_id")
-        mongo.applications.create_index("candidate_id")
-        mongo.interviews.create_index("application_id")
-        mongo.activity_logs.create_index("timestamp")
-        logger.info("MongoDB indexes created successfully")
-        
     except Exception as e:
         logger.error(f"Database initialization error: {e}")
         raise
@@ -90,7 +70,7 @@ def close_db_connections():
     """
     try:
         db_session.remove()
-        MongoDB().client.close()
+        close_mongodb()
         logger.info("Database connections closed successfully")
     except Exception as e:
         logger.error(f"Error closing database connections: {e}")
\ No newline at end of file
@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 import sys
+import asyncio
 import logging
+import qasync
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import Qt, QTranslator, QLocale
+from PyQt6.QtCore import Qt, QTranslator, QLocale, QTimer
 from app.ui.auth_window import AuthWindow
-from app.database.session import db_session, init_db
-from app.database.mongo import MongoDB
 from app.utils.config import config
-from app.utils.security import SecurityUtils
-from app.services.email_service import EmailService
+
+# Database drivers and service clients are imported inside the functions
+# that use them so they load after the window is on screen
 
 def configure_logging():
     """Configure application logging"""
@@ -23,18 +24,22 @@ def configure_logging():
     )
     logging.getLogger('passlib').setLevel(logging.WARNING)
 
-def initialize_database():
+def initialize_database() -> bool:
     """Initialize and verify database connections"""
+    from app.database.session import init_db
+    from app.database.mongo import get_mongodb
+    
     try:
-        # Initialize SQL Database
+        # Initialize SQL Database (create_all already opens a connection,
+        # so no separate ping is needed)
         init_db()
         
-        # Initialize MongoDB
-        MongoDB()
+        # Initialize MongoDB - the one shared client, also used by
+        # app.services.mongodb
+        get_mongodb()
         
-        # Verify connections
-        db_session.execute("SELECT 1")
         logging.info("Database connections established successfully")
+        return True
     except Exception as e:
         logging.critical(f"Database initialization failed: {str(e)}")
         QMessageBox.critical(
@@ -42,7 +47,31 @@ def initialize_database():
             "Database Error",
             f"Failed to initialize database:\n{str(e)}"
         )
-        sys.exit(1)
+        return False
+
+def verify_password_hashing():
+    """
+    Check password hashing is slow enough to resist brute force.
+
+    The timing runs on a hashing worker so the window stays responsive,
+    and a fast result only logs a warning rather than refusing to start.
+    """
+    from app.services.auth_service import submit_password_benchmark
+    
+    def report(future):
+        try:
+            hash_ms = future.result()
+        except Exception as e:
+            logging.error(f"Password hashing benchmark failed: {str(e)}")
+            return
+        logging.info(f"Argon2id time cost {config.ARGON2_TIME_COST}: {hash_ms:.0f} ms per hash")
+        if hash_ms < config.PASSWORD_MIN_HASH_MS:
+            logging.warning(
+                f"Password hashing takes {hash_ms:.0f} ms, below {config.PASSWORD_MIN_HASH_MS} ms; "
+                f"consider increasing ARGON2_TIME_COST (currently {config.ARGON2_TIME_COST})"
+            )
+    
+    submit_password_benchmark().add_done_callback(report)
 
 def configure_application(app):
     """Configure application settings and styles"""
@@ -70,16 +99,17 @@ def configure_application(app):
 
 def verify_services():
     """Verify critical external services"""
+    from app.services.email_service import email_service
+    
     try:
-        # Verify email service
-        email_service = EmailService(
-            smtp_server=config.SMTP_SERVER,
-            smtp_port=config.SMTP_PORT,
-            username=config.EMAIL_USERNAME,
-            password=config.EMAIL_PASSWORD
-        )
+        # Verify email service; the connection stays open for later sends
         email_service.verify_connection()
         
+        # Generation doesn't probe Ollama per request; a missing model shows up here
+        if not (config.HF_API_TOKEN and config.HF_MODEL):
+            import ollama
+            ollama.Client(host=config.OLLAMA_BASE_URL).show(config.OLLAMA_MODEL)
+        
         # Verify security configuration
         if not config.SECRET_KEY or config.SECRET_KEY == "your-secret-key-here":
             logging.warning("Insecure secret key configuration detected")
@@ -93,21 +123,29 @@ def verify_services():
             f"Some services may not be available:\n{str(e)}"
         )
 
+def run_startup_checks(app):
+    """Verify databases and external services once the window is visible"""
+    if not initialize_database():
+        app.exit(1)
+        return
+    verify_services()
+    
+    from app.services.auth_service import warm_password_pool
+    warm_password_pool()
+    verify_password_hashing()
+
 def main():
     """Main application entry point"""
     # Configure logging
     configure_logging()
     
-    # Create application instance
+    # Create application instance; asyncio runs on top of the Qt event
+    # loop so service coroutines can be awaited directly from slots
     app = QApplication(sys.argv)
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
     
     try:
-        # Initialize and verify databases
-        initialize_database()
-        
-        # Verify critical services
-        verify_services()
-        
         # Configure application settings
         configure_application(app)
         
@@ -115,8 +153,17 @@ def main():
         auth_window = AuthWindow()
         auth_window.show()
         
-        # Execute application
-        sys.exit(app.exec())
+        # Database and SMTP round-trips run on the first event loop
+        # iteration so they do not delay the first paint
+        QTimer.singleShot(0, lambda: run_startup_checks(app))
+        
+        # Execute application; once the window closes, write any activity
+        # logs still queued before the connection goes away
+        with loop:
+            exit_code = loop.run_forever()
+            from app.database.mongo import shutdown_mongodb
+            loop.run_until_complete(shutdown_mongodb())
+            sys.exit(exit_code)
         
     except Exception as e:
         logging.critical(f"Application startup failed: {str(e)}")
@@ -1,49 +1,44 @@
 import logging
-import time
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
-from app.utils.config import settings
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from app.database.mongo import MongoDB, get_mongodb, close_mongodb
 
 logger = logging.getLogger(__name__)
 
 class MongoDBConnection:
+    """
+    Lazy handle on the shared Motor database.
+
+    Nothing connects at import time; the client is created by the first
+    get_database() call. Motor binds to the event loop on first use, so
+    the handle must be used from inside the running loop.
+    """
+
     def __init__(self):
-        self.client = None
-        self.db = None
-        self.connect_to_mongodb()
-
-    def connect_to_mongodb(self, retries=5, retry_delay=5):
-        """Establish connection to MongoDB with retry mechanism."""
-        for attempt in range(retries):
-            try:
-                self.client = MongoClient(
-                    settings.MONGO_URI,
-                    serverSelectionTimeoutMS=settings.MONGO_TIMEOUT_MS,
-                    maxPoolSize=settings.MONGO_MAX_POOL_SIZE
-                )
-                self.db = self.client[settings.MONGO_DB_NAME]
-                # Test connection
-                self.client.admin.command('ping')
-                logger.info("Successfully connected to MongoDB")
-                return
-            except ConnectionFailure as e:
-                logger.error(f"MongoDB connection failed (Attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(retry_delay)
-                else:
-                    logger.critical("All MongoDB connection attempts failed. Exiting.")
-                    raise
-
-    def get_database(self):
-        """Return the MongoDB database instance."""
-        if not self.db:
-            raise RuntimeError("MongoDB connection is not established.")
+        self.client: Optional[AsyncIOMotorClient] = None
+        self.db: Optional[AsyncIOMotorDatabase] = None
+
+    async def connect(self) -> AsyncIOMotorDatabase:
+        """Verify the connection with a ping and return the database."""
+        db = self.get_database()
+        await self.client.admin.command('ping')
+        logger.info("Successfully connected to MongoDB")
+        return db
+
+    def get_database(self) -> AsyncIOMotorDatabase:
+        """Return the Motor database instance, connecting on first use."""
+        if self.db is None:
+            mongo = get_mongodb()
+            self.client = mongo.async_client
+            self.db = mongo.async_db.with_options(codec_options=MongoDB.CODEC_OPTIONS)
         return self.db
 
     def close_connection(self):
         """Close the MongoDB connection."""
-        if self.client:
-            self.client.close()
+        if self.client is not None:
+            close_mongodb()
+            self.client = None
+            self.db = None
             logger.info("MongoDB connection closed.")
 
 # Singleton instance of MongoDB connection
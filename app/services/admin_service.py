@@ -1,16 +1,62 @@
+import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Union
 from bson import ObjectId
 from pymongo import DESCENDING, ASCENDING
-from app.database.mongo import mongodb
+from app.database.mongo import get_mongodb
 from app.models import ActivityLog, UserInDB, JobInDB
-from app.services.email_service import EmailService
+from app.services.email_service import email_service
 import logging
 from app.utils.config import settings
+from app.utils.cache import AsyncTTLCache
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Fields read by _convert_user / _convert_job; list queries fetch nothing else
+USER_LIST_PROJECTION = {
+    "_id": 1, "email": 1, "first_name": 1, "last_name": 1,
+    "role": 1, "is_active": 1, "created_at": 1, "last_login": 1
+}
+JOB_LIST_PROJECTION = {
+    "_id": 1, "title": 1, "department": 1, "location": 1,
+    "status": 1, "creator_email": 1, "created_at": 1
+}
+
+# Shared by every AdminService so concurrent dashboards reuse one computation;
+# created on first use so importing this module doesn't load settings
+@lru_cache(maxsize=1)
+def _stats_cache() -> AsyncTTLCache:
+    return AsyncTTLCache(ttl=settings.ADMIN_CACHE_TTL_SECONDS)
+
+@lru_cache(maxsize=1)
+def _pending_jobs_cache() -> AsyncTTLCache:
+    return AsyncTTLCache(ttl=settings.ADMIN_CACHE_TTL_SECONDS)
+
+TIME_RANGE_UNITS = {
+    "h": "hours",
+    "d": "days",
+    "w": "weeks",
+    "m": "weeks"  # Approximate month as 4 weeks
+}
+
+@lru_cache(maxsize=32)
+def _parse_time_range(time_range: str) -> timedelta:
+    """Convert time range string to timedelta"""
+    try:
+        value = int(time_range[:-1])
+        unit = time_range[-1].lower()
+        
+        if unit not in TIME_RANGE_UNITS:
+            raise ValueError("Invalid time unit")
+            
+        return timedelta(**{TIME_RANGE_UNITS[unit]: value})
+    except (ValueError, IndexError):
+        return timedelta(days=7)  # Default to 7 days
+
 class AdminService:
     def __init__(self, admin_email: str):
         """
@@ -20,39 +66,66 @@ class AdminService:
             admin_email: Email of the admin user
         """
         self.admin_email = admin_email
-        self.email_service = EmailService()
-        self.db = mongodb
-        self.users_col = self.db.users
-        self.jobs_col = self.db.jobs
-        self.applications_col = self.db.applications
-        self.activity_col = self.db.activity_logs
+        self.email_service = email_service
+        self.db = get_mongodb()
+        self.users_col = self.db.get_collection("users")
+        self.jobs_col = self.db.get_collection("jobs")
+        self.applications_col = self.db.get_collection("applications")
+        self.activity_col = self.db.get_collection("activity_logs")
     
     async def get_all_users(
         self, 
         page: int = 1, 
         per_page: int = 10,
         role: Optional[str] = None,
-        active: Optional[bool] = None
+        active: Optional[bool] = None,
+        after_id: Optional[str] = None
     ) -> Dict[str, Union[List[Dict], int]]:
-        """Get paginated list of users with optional filtering"""
+        """
+        Get paginated list of users with optional filtering
+        
+        Pass the previous page's next_cursor as after_id to continue with a
+        range scan on _id instead of skipping over earlier pages; total is
+        then the number of users after the cursor.
+        """
         try:
-            skip = (page - 1) * per_page
+            skip = 0 if after_id else (page - 1) * per_page
             query = {}
             
             if role:
                 query["role"] = role
             if active is not None:
                 query["is_active"] = active
+            if after_id:
+                if not ObjectId.is_valid(after_id):
+                    raise HTTPException(status_code=400, detail="Invalid cursor")
+                query["_id"] = {"$gt": ObjectId(after_id)}
                 
-            total = await self.users_col.count_documents(query)
-            users = await self.users_col.find(query).skip(skip).limit(per_page).to_list(per_page)
+            # Page and total in one server pass
+            result = await self.users_col.aggregate([
+                {"$match": query},
+                {"$sort": {"_id": ASCENDING}},
+                {"$facet": {
+                    "data": [
+                        {"$skip": skip},
+                        {"$limit": per_page},
+                        {"$project": USER_LIST_PROJECTION}
+                    ],
+                    "total": [{"$count": "n"}]
+                }}
+            ]).to_list(1)
+            page_result = result[0]
+            users = [self._convert_user(user) for user in page_result["data"]]
             
             return {
-                "data": [await self._convert_user(user) for user in users],
-                "total": total,
+                "data": users,
+                "total": self._facet_total(page_result),
                 "page": page,
-                "per_page": per_page
+                "per_page": per_page,
+                "next_cursor": users[-1]["id"] if len(users) == per_page else None
             }
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error fetching users: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to fetch users")
@@ -63,18 +136,23 @@ class AdminService:
             if not ObjectId.is_valid(user_id):
                 raise HTTPException(status_code=400, detail="Invalid user ID")
                 
-            user = await self.users_col.find_one({"_id": ObjectId(user_id)})
+            user = await self.users_col.find_one(
+                {"_id": ObjectId(user_id)},
+                {"password_hash": 0}
+            )
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
                 
-            applications_count = await self.applications_col.count_documents({"candidate_id": user_id})
-            last_activity = await self._get_last_activity(user["email"])
+            applications_count, last_activity = await asyncio.gather(
+                self.applications_col.count_documents({"candidate_id": user_id}),
+                self._get_last_activity(user["email"])
+            )
             
             return {
-                **await self._convert_user(user),
+                **self._convert_user(user),
                 "applications_count": applications_count,
                 "last_activity": last_activity,
-                "profile_completeness": await self._calculate_profile_completeness(user)
+                "profile_completeness": self._calculate_profile_completeness(user)
             }
         except HTTPException:
             raise
@@ -88,7 +166,10 @@ class AdminService:
             if not ObjectId.is_valid(user_id):
                 raise HTTPException(status_code=400, detail="Invalid user ID")
                 
-            user = await self.users_col.find_one({"_id": ObjectId(user_id)})
+            user = await self.users_col.find_one(
+                {"_id": ObjectId(user_id)},
+                {"email": 1, "is_active": 1}
+            )
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
                 
@@ -101,7 +182,10 @@ class AdminService:
             if result.modified_count == 0:
                 raise HTTPException(status_code=400, detail="Failed to update user status")
             
-            await self._log_activity(f"Set user {user['email']} status to {'active' if new_status else 'inactive'}")
+            await self._log_activity(
+                f"Set user {user['email']} status to {'active' if new_status else 'inactive'}",
+                category="user"
+            )
             
             if not new_status:
                 await self._notify_user_deactivation(user["email"])
@@ -122,50 +206,92 @@ class AdminService:
     ) -> Dict[str, Union[List[Dict], int]]:
         """Get paginated list of jobs pending approval with sorting"""
         try:
-            skip = (page - 1) * per_page
-            sort_direction = DESCENDING if sort_order.lower() == "desc" else ASCENDING
-            
-            total = await self.jobs_col.count_documents({"status": "pending"})
-            jobs = await self.jobs_col.find({"status": "pending"}) \
-                .sort(sort_by, sort_direction) \
-                .skip(skip) \
-                .limit(per_page) \
-                .to_list(per_page)
-            
-            return {
-                "data": [await self._convert_job(job) for job in jobs],
-                "total": total,
-                "page": page,
-                "per_page": per_page
-            }
+            if page == 1:
+                # The first page is what the dashboard shows on every refresh
+                return await _pending_jobs_cache().get_or_compute(
+                    (per_page, sort_by, sort_order.lower()),
+                    lambda: self._fetch_pending_jobs(page, per_page, sort_by, sort_order)
+                )
+            return await self._fetch_pending_jobs(page, per_page, sort_by, sort_order)
         except Exception as e:
             logger.error(f"Error fetching pending jobs: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to fetch pending jobs")
 
+    async def _fetch_pending_jobs(
+        self,
+        page: int,
+        per_page: int,
+        sort_by: str,
+        sort_order: str
+    ) -> Dict[str, Union[List[Dict], int]]:
+        """Query one page of pending jobs with their application counts"""
+        skip = (page - 1) * per_page
+        sort_direction = DESCENDING if sort_order.lower() == "desc" else ASCENDING
+        
+        # Page and total in one server pass; application counts are joined
+        # server-side for the page only instead of one count per job
+        result = await self.jobs_col.aggregate([
+            {"$match": {"status": "pending"}},
+            {"$sort": {sort_by: sort_direction}},
+            {"$facet": {
+                "data": [
+                    {"$skip": skip},
+                    {"$limit": per_page},
+                    {"$project": JOB_LIST_PROJECTION},
+                    {"$lookup": {
+                        "from": "applications",
+                        "let": {"job_id": {"$toString": "$_id"}},
+                        "pipeline": [
+                            {"$match": {"$expr": {"$eq": ["$job_id", "$$job_id"]}}},
+                            {"$count": "n"}
+                        ],
+                        "as": "applications"
+                    }},
+                    {"$addFields": {
+                        "applications_count": {"$ifNull": [{"$arrayElemAt": ["$applications.n", 0]}, 0]}
+                    }}
+                ],
+                "total": [{"$count": "n"}]
+            }}
+        ]).to_list(1)
+        page_result = result[0]
+        
+        return {
+            "data": [self._convert_job(job) for job in page_result["data"]],
+            "total": self._facet_total(page_result),
+            "page": page,
+            "per_page": per_page
+        }
+
     async def approve_job(self, job_id: str) -> Dict:
         """Approve a job posting"""
         try:
             if not ObjectId.is_valid(job_id):
                 raise HTTPException(status_code=400, detail="Invalid job ID")
                 
-            job = await self.jobs_col.find_one({"_id": ObjectId(job_id)})
+            job = await self.jobs_col.find_one(
+                {"_id": ObjectId(job_id)},
+                {"title": 1, "creator_email": 1}
+            )
             if not job:
                 raise HTTPException(status_code=404, detail="Job not found")
                 
+            now = datetime.utcnow()
             result = await self.jobs_col.update_one(
                 {"_id": ObjectId(job_id)},
                 {"$set": {
                     "status": "approved",
-                    "approved_at": datetime.utcnow(),
+                    "approved_at": now,
                     "approved_by": self.admin_email,
-                    "updated_at": datetime.utcnow()
+                    "updated_at": now
                 }}
             )
             
             if result.modified_count == 0:
                 raise HTTPException(status_code=400, detail="Failed to approve job")
+            _pending_jobs_cache().invalidate()
             
-            await self._log_activity(f"Approved job: {job['title']} (ID: {job_id})")
+            await self._log_activity(f"Approved job: {job['title']} (ID: {job_id})", category="job")
             await self._notify_job_approval(job["creator_email"], job["title"])
             
             return {"success": True, "job_id": job_id}
@@ -178,65 +304,102 @@ class AdminService:
     async def get_system_stats(self, time_range: str = "7d") -> Dict:
         """Get comprehensive system statistics for a time range"""
         try:
-            time_delta = self._parse_time_range(time_range)
-            cutoff_date = datetime.utcnow() - time_delta
-            
-            stats = {
-                "users": {
-                    "total": await self.users_col.count_documents({}),
-                    "active": await self.users_col.count_documents({"is_active": True}),
-                    "new": await self.users_col.count_documents({"created_at": {"$gte": cutoff_date}}),
-                    "by_role": {
-                        "candidate": await self.users_col.count_documents({"role": "candidate"}),
-                        "recruiter": await self.users_col.count_documents({"role": "recruiter"}),
-                        "admin": await self.users_col.count_documents({"role": "admin"}),
-                    }
-                },
-                "jobs": {
-                    "total": await self.jobs_col.count_documents({}),
-                    "pending": await self.jobs_col.count_documents({"status": "pending"}),
-                    "approved": await self.jobs_col.count_documents({"status": "approved"}),
-                    "new": await self.jobs_col.count_documents({"created_at": {"$gte": cutoff_date}}),
-                },
-                "applications": {
-                    "total": await self.applications_col.count_documents({}),
-                    "new": await self.applications_col.count_documents({"created_at": {"$gte": cutoff_date}}),
-                    "by_status": {
-                        "applied": await self.applications_col.count_documents({"status": "applied"}),
-                        "interviewed": await self.applications_col.count_documents({"status": "interviewed"}),
-                        "hired": await self.applications_col.count_documents({"status": "hired"}),
-                    }
-                },
-                "activity": await self._get_activity_stats(cutoff_date),
-            }
-            return stats
+            return await _stats_cache().get_or_compute(
+                time_range,
+                lambda: self._compute_system_stats(time_range)
+            )
         except Exception as e:
             logger.error(f"Error fetching system stats: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to fetch system statistics")
 
-    async def _calculate_profile_completeness(self, user: Dict) -> float:
+    async def _compute_system_stats(self, time_range: str) -> Dict:
+        """Run the statistics queries for a time range"""
+        time_delta = _parse_time_range(time_range)
+        cutoff_date = datetime.utcnow() - time_delta
+        
+        # All counts are independent, so run them concurrently on the pool.
+        # Unfiltered totals come from collection metadata, which may lag
+        # slightly behind recent writes - fine for a dashboard.
+        (
+            users_total, users_active, users_new, users_by_role,
+            jobs_total, jobs_new, jobs_by_status,
+            applications_total, applications_new, applications_by_status,
+            activity
+        ) = await asyncio.gather(
+            self.users_col.estimated_document_count(),
+            self.users_col.count_documents({"is_active": True}),
+            self.users_col.count_documents({"created_at": {"$gte": cutoff_date}}),
+            self._count_by(self.users_col, "role"),
+            self.jobs_col.estimated_document_count(),
+            self.jobs_col.count_documents({"created_at": {"$gte": cutoff_date}}),
+            self._count_by(self.jobs_col, "status"),
+            self.applications_col.estimated_document_count(),
+            self.applications_col.count_documents({"created_at": {"$gte": cutoff_date}}),
+            self._count_by(self.applications_col, "status"),
+            self._get_activity_stats(cutoff_date),
+        )
+        
+        stats = {
+            "users": {
+                "total": users_total,
+                "active": users_active,
+                "new": users_new,
+                "by_role": {
+                    "candidate": users_by_role.get("candidate", 0),
+                    "recruiter": users_by_role.get("recruiter", 0),
+                    "admin": users_by_role.get("admin", 0),
+                }
+            },
+            "jobs": {
+                "total": jobs_total,
+                "pending": jobs_by_status.get("pending", 0),
+                "approved": jobs_by_status.get("approved", 0),
+                "new": jobs_new,
+            },
+            "applications": {
+                "total": applications_total,
+                "new": applications_new,
+                "by_status": {
+                    "applied": applications_by_status.get("applied", 0),
+                    "interviewed": applications_by_status.get("interviewed", 0),
+                    "hired": applications_by_status.get("hired", 0),
+                }
+            },
+            "activity": activity,
+        }
+        return stats
+
+    @staticmethod
+    def _facet_total(page_result: Dict) -> int:
+        """Read the {"$count": "n"} branch of a $facet result (empty when no matches)"""
+        return page_result["total"][0]["n"] if page_result["total"] else 0
+
+    async def _count_by(self, collection, field: str) -> Dict[str, int]:
+        """Count documents per distinct value of an indexed field in one pass"""
+        groups = await collection.aggregate([
+            {"$group": {"_id": f"${field}", "count": {"$sum": 1}}}
+        ]).to_list(None)
+        return {group["_id"]: group["count"] for group in groups}
+
+    def _calculate_profile_completeness(self, user: Dict) -> float:
         """Calculate how complete a user's profile is"""
         required_fields = ["first_name", "last_name", "skills", "experience"]
         completed = sum(1 for field in required_fields if user.get(field))
         return (completed / len(required_fields)) * 100
 
     async def _get_activity_stats(self, cutoff_date: datetime) -> Dict:
-        """Get activity statistics"""
+        """Get activity statistics from one indexed range scan grouped by category"""
+        groups = await self.activity_col.aggregate([
+            {"$match": {"timestamp": {"$gte": cutoff_date}}},
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}}
+        ]).to_list(None)
+        by_category = {group["_id"]: group["count"] for group in groups}
         return {
-            "total": await self.activity_col.count_documents({"timestamp": {"$gte": cutoff_date}}),
+            "total": sum(by_category.values()),
             "by_type": {
-                "user": await self.activity_col.count_documents({
-                    "timestamp": {"$gte": cutoff_date},
-                    "action": {"$regex": "^User"}
-                }),
-                "job": await self.activity_col.count_documents({
-                    "timestamp": {"$gte": cutoff_date},
-                    "action": {"$regex": "^Job"}
-                }),
-                "application": await self.activity_col.count_documents({
-                    "timestamp": {"$gte": cutoff_date},
-                    "action": {"$regex": "^Application"}
-                })
+                "user": by_category.get("user", 0),
+                "job": by_category.get("job", 0),
+                "application": by_category.get("application", 0)
             }
         }
 
@@ -247,17 +410,24 @@ class AdminService:
                 {"user_email": email},
                 sort=[("timestamp", DESCENDING)]
             )
-            return activity["timestamp"].strftime("%Y-%m-%d %H:%M") if activity else None
+            return activity["timestamp"].strftime(DATETIME_FORMAT) if activity else None
         except Exception as e:
             logger.error(f"Error fetching user activity: {str(e)}")
             return None
 
-    async def _log_activity(self, action: str):
-        """Log admin activity"""
+    async def _log_activity(self, action: str, category: str = "admin"):
+        """
+        Queue admin activity for the batched activity log writer
+        
+        Args:
+            action: Human readable description of the action
+            category: Entity affected ('user', 'job', 'application' or 'admin')
+        """
         try:
-            await self.activity_col.insert_one({
+            await self.db.log_activity({
                 "user_email": self.admin_email,
                 "action": action,
+                "category": category,
                 "timestamp": datetime.utcnow(),
                 "type": "admin"
             })
@@ -268,35 +438,15 @@ class AdminService:
         """Send notification about account deactivation"""
         subject = "Your account status has changed"
         body = f"Your account has been deactivated by the administrator."
-        await self.email_service.send_email(user_email, subject, body)
+        await self.email_service.send_email_async(user_email, subject, body)
 
     async def _notify_job_approval(self, recruiter_email: str, job_title: str):
         """Notify recruiter about job approval"""
         subject = f"Your job posting has been approved"
         body = f"Your job posting '{job_title}' has been approved and is now visible to candidates."
-        await self.email_service.send_email(recruiter_email, subject, body)
+        await self.email_service.send_email_async(recruiter_email, subject, body)
 
-    def _parse_time_range(self, time_range: str) -> timedelta:
-        """Convert time range string to timedelta"""
-        units = {
-            "h": "hours",
-            "d": "days",
-            "w": "weeks",
-            "m": "weeks"  # Approximate month as 4 weeks
-        }
-        
-        try:
-            value = int(time_range[:-1])
-            unit = time_range[-1].lower()
-            
-            if unit not in units:
-                raise ValueError("Invalid time unit")
-                
-            return timedelta(**{units[unit]: value})
-        except (ValueError, IndexError):
-            return timedelta(days=7)  # Default to 7 days
-
-    async def _convert_user(self, user: Dict) -> Dict:
+    def _convert_user(self, user: Dict) -> Dict:
         """Convert user document to response format"""
         return {
             "id": str(user["_id"]),
@@ -305,14 +455,12 @@ class AdminService:
             "last_name": user.get("last_name", ""),
             "role": user["role"],
             "is_active": user.get("is_active", True),
-            "created_at": user["created_at"].strftime("%Y-%m-%d"),
+            "created_at": user["created_at"].date().isoformat(),
             "last_login": user.get("last_login", ""),
         }
 
-    async def _convert_job(self, job: Dict) -> Dict:
+    def _convert_job(self, job: Dict) -> Dict:
         """Convert job document to response format"""
-        applications_count = await self.applications_col.count_documents({"job_id": str(job["_id"])})
-        
         return {
             "id": str(job["_id"]),
             "title": job["title"],
@@ -320,6 +468,6 @@ class AdminService:
             "location": job["location"],
             "status": job["status"],
             "creator_email": job["creator_email"],
-            "created_at": job["created_at"].strftime("%Y-%m-%d"),
-            "applications_count": applications_count,
+            "created_at": job["created_at"].date().isoformat(),
+            "applications_count": job.get("applications_count", 0),
         }
\ No newline at end of file
@@ -1,20 +1,125 @@
+import os
 import re
-from app.database.mongo import mongo
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor
+from app.database import get_users_collection
 from app.database.models import User
+from app.utils.config import settings
+from app.utils.cache import AsyncTTLCache
+from cachetools import TTLCache
 from datetime import datetime
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 import logging
 from typing import Tuple, Optional
 from fastapi import HTTPException
-from pymongo.errors import PyMongoError
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, PyMongoError
 
 logger = logging.getLogger(__name__)
 
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# Fields login needs from the user document
+LOGIN_PROJECTION = {"_id": 0, "password_hash": 1, "role": 1, "is_active": 1, "login_attempts": 1}
+
+# Longer inputs are rejected before any hashing work is done
+PASSWORD_MAX_BYTES = 1024
+# bcrypt ignores everything past this many bytes
+BCRYPT_MAX_BYTES = 72
+
+# How long a stored failed-attempt count is trusted before re-reading it
+LOCKOUT_CACHE_TTL_SECONDS = 30
+
+# Failed attempts per email seen by this process, forgotten once an email
+# has had no failures for LOCKOUT_WINDOW_SECONDS. Bounded so probing many
+# addresses cannot grow it without limit; the login_attempts counter on
+# the user document is what separate processes share.
+LOCKOUT_WINDOW_SECONDS = 900
+_failed_attempts = TTLCache(maxsize=10000, ttl=LOCKOUT_WINDOW_SECONDS)
+
+# Argon2 (time_cost, memory_cost, parallelism) handed to each hashing worker
+# by the pool initializer, so workers never load settings themselves
+_worker_argon2_params: Optional[Tuple[int, int, int]] = None
+
+def _argon2_params() -> Tuple[int, int, int]:
+    if _worker_argon2_params is not None:
+        return _worker_argon2_params
+    return settings.ARGON2_TIME_COST, settings.ARGON2_MEMORY_COST, settings.ARGON2_PARALLELISM
+
+def _init_password_worker(argon2_params: Tuple[int, int, int]):
+    global _worker_argon2_params
+    _worker_argon2_params = argon2_params
+    _password_hasher.cache_clear()
+
+# New passwords are hashed with Argon2id; bcrypt hashes from before are
+# still accepted and replaced on the user's next login
+@lru_cache(maxsize=1)
+def _password_hasher() -> PasswordHasher:
+    time_cost, memory_cost, parallelism = _argon2_params()
+    return PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism
+    )
+
+# Hashing is deliberately slow; running it in worker processes keeps the
+# event loop responsive and lets concurrent logins use separate cores
+PASSWORD_WORKERS = os.cpu_count() or 1
+
+_password_pool: Optional[ProcessPoolExecutor] = None
+_password_pool_lock = threading.Lock()
+
+def _get_password_pool() -> ProcessPoolExecutor:
+    """Shared password hashing pool, started on first use"""
+    global _password_pool
+    if _password_pool is None:
+        with _password_pool_lock:
+            if _password_pool is None:
+                _password_pool = ProcessPoolExecutor(
+                    max_workers=PASSWORD_WORKERS,
+                    initializer=_init_password_worker,
+                    initargs=(_argon2_params(),)
+                )
+    return _password_pool
+
+def _hash_password(password: str) -> str:
+    return _password_hasher().hash(password)
+
+def _verify_password(password: str, hashed_pw: str) -> bool:
+    """Check a password against an Argon2id hash or a legacy bcrypt one"""
+    if hashed_pw.startswith("$argon2"):
+        try:
+            return _password_hasher().verify(hashed_pw, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return bcrypt.checkpw(password.encode()[:BCRYPT_MAX_BYTES], hashed_pw.encode())
+
+def benchmark_password_hash() -> float:
+    """Milliseconds one hash takes with the configured Argon2 parameters on this host"""
+    started = time.perf_counter()
+    _hash_password("benchmark-password")
+    return (time.perf_counter() - started) * 1000
+
+def submit_password_benchmark() -> Future:
+    """Time one hash on a hashing worker; the future's result is in milliseconds"""
+    return _get_password_pool().submit(benchmark_password_hash)
+
+def warm_password_pool():
+    """Start the hashing workers ahead of the first login"""
+    pool = _get_password_pool()
+    for _ in range(PASSWORD_WORKERS):
+        pool.submit(int)
+
 class AuthService:
     def __init__(self):
         self.password_min_length = 8
         self.max_login_attempts = 5
-        self.login_attempts = {}
+        self._lock_cache = AsyncTTLCache(ttl=LOCKOUT_CACHE_TTL_SECONDS, maxsize=1024)
 
     async def register(
         self, 
@@ -59,17 +164,9 @@ class AuthService:
                 detail="Invalid user role"
             )
 
-        # Check if user exists
-        existing_user = await mongo.db.users.find_one({"email": email})
-        if existing_user:
-            raise HTTPException(
-                status_code=400,
-                detail="Email already registered"
-            )
-        
         try:
             # Hash password
-            hashed_pw = self._hash_password(password)
+            hashed_pw = await self._hash_password(password)
             
             # Create user
             user = User(
@@ -84,8 +181,8 @@ class AuthService:
                 login_attempts=0
             )
             
-            # Insert into database
-            result = await mongo.db.users.insert_one(user.dict(by_alias=True))
+            # Insert into database; the unique email index rejects duplicates
+            result = await get_users_collection().insert_one(user.dict(by_alias=True))
             
             if not result.inserted_id:
                 raise HTTPException(
@@ -95,6 +192,11 @@ class AuthService:
                 
             return True, "Registration successful"
             
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=400,
+                detail="Email already registered"
+            )
         except PyMongoError as e:
             logger.error(f"Database error during registration: {str(e)}")
             raise HTTPException(
@@ -124,36 +226,52 @@ class AuthService:
             HTTPException: If account is locked or other errors occur
         """
         try:
+            # Nothing that long was ever accepted as a password
+            if len(password) > PASSWORD_MAX_BYTES:
+                return False, None
+                
             # Check login attempts
-            if self._is_account_locked(email):
+            if await self._is_account_locked(email):
                 raise HTTPException(
                     status_code=403,
                     detail="Account temporarily locked due to too many failed attempts"
                 )
                 
-            # Find user
-            user_data = await mongo.db.users.find_one({"email": email})
+            # Fetch the user and count this attempt in one round trip; the
+            # counter is zeroed again below when the password is right
+            user_data = await get_users_collection().find_one_and_update(
+                {"email": email},
+                {"$inc": {"login_attempts": 1}},
+                projection=LOGIN_PROJECTION,
+                return_document=ReturnDocument.BEFORE
+            )
             if not user_data:
                 self._record_failed_attempt(email)
                 return False, None
-                
-            user = User(**user_data)
+            self._lock_cache.invalidate(email)
             
             # Check if account is active
-            if not user.is_active:
+            if not user_data.get("is_active", True):
                 raise HTTPException(
                     status_code=403,
                     detail="Account is inactive"
                 )
                 
             # Verify password
-            if not self._verify_password(password, user.password_hash):
-                await self._increment_login_attempts(email)
+            if not await self._verify_password(password, user_data["password_hash"]):
+                self._record_failed_attempt(email)
                 return False, None
                 
-            # Reset login attempts on successful login
-            await self._reset_login_attempts(email)
-            return True, user.role
+            # Reset login attempts on successful login, moving bcrypt hashes and
+            # ones made with older Argon2 parameters to the current scheme in
+            # the same write
+            update = {"login_attempts": 0}
+            if self._needs_rehash(user_data["password_hash"]):
+                update["password_hash"] = await self._hash_password(password)
+                update["updated_at"] = datetime.utcnow()
+            await get_users_collection().update_one({"email": email}, {"$set": update})
+            _failed_attempts.pop(email, None)
+            return True, user_data["role"]
             
         except PyMongoError as e:
             logger.error(f"Database error during login: {str(e)}")
@@ -198,19 +316,28 @@ class AuthService:
                     detail=f"New password must be at least {self.password_min_length} characters"
                 )
                 
-            # Verify old credentials
-            auth_success, _ = await self.login(email, old_password)
-            if not auth_success:
+            # Verify old credentials directly - going through login() would
+            # also touch the lockout counters
+            user_data = await get_users_collection().find_one(
+                {"email": email},
+                {"_id": 0, "password_hash": 1, "is_active": 1}
+            )
+            if not user_data or not await self._verify_password(old_password, user_data["password_hash"]):
                 raise HTTPException(
                     status_code=401,
                     detail="Invalid credentials"
                 )
+            if not user_data.get("is_active", True):
+                raise HTTPException(
+                    status_code=403,
+                    detail="Account is inactive"
+                )
                 
             # Hash new password
-            new_hashed_pw = self._hash_password(new_password)
+            new_hashed_pw = await self._hash_password(new_password)
             
             # Update password in database
-            result = await mongo.db.users.update_one(
+            result = await get_users_collection().update_one(
                 {"email": email},
                 {"$set": {
                     "password_hash": new_hashed_pw,
@@ -261,10 +388,10 @@ class AuthService:
                 )
                 
             # Hash new password
-            new_hashed_pw = self._hash_password(new_password)
+            new_hashed_pw = await self._hash_password(new_password)
             
             # Update password in database
-            result = await mongo.db.users.update_one(
+            result = await get_users_collection().update_one(
                 {"email": email},
                 {"$set": {
                     "password_hash": new_hashed_pw,
@@ -307,7 +434,7 @@ class AuthService:
             bool: True if deactivation was successful
         """
         try:
-            result = await mongo.db.users.update_one(
+            result = await get_users_collection().update_one(
                 {"email": email},
                 {"$set": {
                     "is_active": False,
@@ -322,69 +449,61 @@ class AuthService:
                 detail="Account deactivation failed"
             )
 
-    def _hash_password(self, password: str) -> str:
+    async def _hash_password(self, password: str) -> str:
         """Hash a password for storage."""
-        return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_password_pool(), _hash_password, password
+        )
 
-    def _verify_password(self, password: str, hashed_pw: str) -> bool:
+    async def _verify_password(self, password: str, hashed_pw: str) -> bool:
         """Verify a password against its hash."""
-        return bcrypt.checkpw(password.encode(), hashed_pw.encode())
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_password_pool(), _verify_password, password, hashed_pw
+        )
+
+    def _needs_rehash(self, hashed_pw: str) -> bool:
+        """Check whether a stored hash is bcrypt or Argon2 with outdated parameters."""
+        if not hashed_pw.startswith("$argon2"):
+            return True
+        try:
+            return _password_hasher().check_needs_rehash(hashed_pw)
+        except InvalidHashError:
+            return False
 
     def _validate_email(self, email: str) -> bool:
         """Validate email format."""
-        return re.match(r"[^@]+@[^@]+\.[^@]+", email) is not None
+        return _EMAIL_RE.match(email) is not None
 
     def _validate_password(self, password: str) -> bool:
-        """Validate password meets requirements."""
-        return len(password) >= self.password_min_length
-
-    async def _increment_login_attempts(self, email: str):
-        """Record a failed login attempt."""
-        try:
-            await mongo.db.users.update_one(
-                {"email": email},
-                {"$inc": {"login_attempts": 1}},
-                upsert=False
-            )
-            
-            # Update in-memory cache
-            if email not in self.login_attempts:
-                self.login_attempts[email] = 0
-            self.login_attempts[email] += 1
-            
-        except PyMongoError as e:
-            logger.error(f"Failed to record login attempt: {str(e)}")
-
-    async def _reset_login_attempts(self, email: str):
-        """Reset login attempts after successful login."""
-        try:
-            await mongo.db.users.update_one(
-                {"email": email},
-                {"$set": {"login_attempts": 0}}
+        """Validate password meets requirements; raises 400 if it is oversized."""
+        if len(password.encode()) > PASSWORD_MAX_BYTES:
+            raise HTTPException(
+                status_code=400,
+                detail="Password too long"
             )
-            
-            # Clear from in-memory cache
-            if email in self.login_attempts:
-                del self.login_attempts[email]
-                
-        except PyMongoError as e:
-            logger.error(f"Failed to reset login attempts: {str(e)}")
+        return len(password) >= self.password_min_length
 
-    def _is_account_locked(self, email: str) -> bool:
+    async def _is_account_locked(self, email: str) -> bool:
         """Check if account is locked due to too many failed attempts."""
         # First check in-memory cache
-        if email in self.login_attempts and self.login_attempts[email] >= self.max_login_attempts:
-            return True
-            
-        # Fallback to database check
-        user_data = mongo.db.users.find_one({"email": email})
-        if user_data and user_data.get("login_attempts", 0) >= self.max_login_attempts:
+        if _failed_attempts.get(email, 0) >= self.max_login_attempts:
             return True
             
-        return False
+        # Fallback to database check, reused for repeated probes of one email
+        attempts = await self._lock_cache.get_or_compute(
+            email, lambda: self._fetch_login_attempts(email)
+        )
+        return attempts >= self.max_login_attempts
+
+    async def _fetch_login_attempts(self, email: str) -> int:
+        """Read the stored failed-attempt count for an email (0 if unknown)."""
+        user_data = await get_users_collection().find_one(
+            {"email": email},
+            {"_id": 0, "login_attempts": 1}
+        )
+        return user_data.get("login_attempts", 0) if user_data else 0
 
     def _record_failed_attempt(self, email: str):
         """Record failed attempt in memory cache."""
-        if email not in self.login_attempts:
-            self.login_attempts[email] = 0
-        self.login_attempts[email] += 1
\ No newline at end of file
+        # Re-inserting restarts the entry's expiry, so the window slides
+        _failed_attempts[email] = _failed_attempts.get(email, 0) + 1
\ No newline at end of file
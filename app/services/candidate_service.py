@@ -1,13 +1,26 @@
+import asyncio
+from sqlalchemy import insert, select
 from sqlalchemy.exc import SQLAlchemyError
-from app.database.session import db_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.database.session import AsyncSessionLocal
 from app.database.models import Application, Job, User, Interview, InterviewAnswer
-from app.services.s3_service import S3Service
-from app.services.ai_service import AIService
+from app.services.s3_service import get_s3_service
+from app.services.ai_service import get_ai_service
+from app.utils.cache import AsyncTTLCache
+from app.utils.config import settings
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _available_jobs_cache() -> AsyncTTLCache:
+    """Approved jobs are the same for every candidate and change rarely"""
+    return AsyncTTLCache(ttl=settings.JOB_LIST_CACHE_TTL_SECONDS, maxsize=1)
+
 class CandidateService:
     def __init__(self, email: str):
         """
@@ -17,10 +30,19 @@ class CandidateService:
             email: The candidate's email address
         """
         self.email = email
-        self.s3_service = S3Service()
-        self.ai_service = AIService()
+        self.s3_service = get_s3_service()
+        self.ai_service = get_ai_service()
+        self._candidate_id: Optional[int] = None
+    
+    async def _get_candidate_id(self, session: AsyncSession) -> Optional[int]:
+        """The candidate's user ID, looked up once by email and then reused"""
+        if self._candidate_id is None:
+            self._candidate_id = await session.scalar(
+                select(User.id).where(User.email == self.email)
+            )
+        return self._candidate_id
     
-    def get_available_jobs(self) -> list[dict]:
+    async def get_available_jobs(self) -> list[dict]:
         """
         Get all available (approved) jobs.
         
@@ -28,22 +50,43 @@ class CandidateService:
             List of dictionaries containing job details
         """
         try:
-            jobs = db_session.query(Job).filter(Job.status == "approved").all()
-            return [{
-                'id': job.id,
-                'title': job.title,
-                'department': job.department,
-                'location': job.location,
-                'salary_min': job.salary_min,
-                'salary_max': job.salary_max,
-                'description': job.description,
-                'skills': [skill.skill for skill in job.skills]
-            } for job in jobs]
+            return await _available_jobs_cache().get_or_compute("approved", self._fetch_available_jobs)
         except SQLAlchemyError as e:
             logger.error(f"Error fetching available jobs: {e}")
             return []
     
-    def apply_for_job(self, job_id: int, resume_path: str) -> bool:
+    async def get_job_details(self, job_title: str) -> Optional[dict]:
+        """
+        Get an available job by title, served from the cached job list.
+        
+        Args:
+            job_title: The title of the job
+            
+        Returns:
+            The job's details, or None if no approved job has that title
+        """
+        jobs = await self.get_available_jobs()
+        return next((job for job in jobs if job['title'] == job_title), None)
+    
+    async def _fetch_available_jobs(self) -> list[dict]:
+        """Query approved jobs with their skills"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Job).where(Job.status == "approved").options(selectinload(Job.skills))
+            )
+            jobs = result.scalars().all()
+        return [{
+            'id': job.id,
+            'title': job.title,
+            'department': job.department,
+            'location': job.location,
+            'salary_min': job.salary_min,
+            'salary_max': job.salary_max,
+            'description': job.description,
+            'skills': [skill.skill for skill in job.skills]
+        } for job in jobs]
+    
+    async def apply_for_job(self, job_id: int, resume_path: str) -> bool:
         """
         Apply for a job by submitting a resume.
         
@@ -55,52 +98,53 @@ class CandidateService:
             True if application was successful, False otherwise
         """
         try:
-            # Upload resume to S3
-            success, s3_key = self.s3_service.upload_resume(resume_path, self.email)
+            # Upload resume to S3 and extract its text side by side - neither
+            # depends on the other
+            (success, s3_key), resume_text = await asyncio.gather(
+                self.s3_service.upload_resume_async(resume_path, self.email),
+                asyncio.to_thread(self.ai_service.extract_text_from_file, resume_path)
+            )
             if not success:
                 return False
             
-            # Extract text from resume
-            resume_text = self.ai_service.extract_text_from_file(resume_path)
-            
-            # Get job details
-            job = db_session.query(Job).get(job_id)
-            if not job:
-                return False
-            
-            # Generate match score
-            _, match_score = self.ai_service.generate_resume_summary(resume_text, job.description)
-            
-            # Get candidate
-            candidate = db_session.query(User).filter(User.email == self.email).first()
-            if not candidate:
-                return False
-            
-            # Create application
-            application = Application(
-                job_id=job_id,
-                candidate_id=candidate.id,
-                resume_s3_key=s3_key,
-                resume_text=resume_text[:2000],  # Store first 2000 chars
-                match_score=match_score,
-                status="applied",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            
-            db_session.add(application)
-            db_session.commit()
+            async with AsyncSessionLocal() as session:
+                # Get job details
+                job = await session.get(Job, job_id)
+                if not job:
+                    return False
+                
+                # Generate match score
+                _, match_score = self.ai_service.generate_resume_summary(resume_text, job.description)
+                
+                # Get candidate
+                candidate_id = await self._get_candidate_id(session)
+                if candidate_id is None:
+                    return False
+                
+                # Create application
+                now = datetime.utcnow()
+                session.add(Application(
+                    job_id=job_id,
+                    candidate_id=candidate_id,
+                    resume_s3_key=s3_key,
+                    resume_text=resume_text[:2000],  # Store first 2000 chars
+                    match_score=match_score,
+                    status="applied",
+                    created_at=now,
+                    updated_at=now
+                ))
+                await session.commit()
             
             return True
         except SQLAlchemyError as e:
-            db_session.rollback()
+            # Leaving the session block rolled back the transaction
             logger.error(f"Database error applying for job: {e}")
             return False
         except Exception as e:
             logger.error(f"Error applying for job: {e}")
             return False
     
-    def start_interview(self, job_id: int) -> list:
+    async def start_interview(self, job_id: int) -> list:
         """
         Start an interview for a specific job application.
         
@@ -111,18 +155,23 @@ class CandidateService:
             List of interview questions or empty list if error occurs
         """
         try:
-            application = db_session.query(Application).filter(
-                Application.job_id == job_id,
-                Application.candidate.has(email=self.email)
-            ).first()
+            # Resume text and job description in one query
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Application.resume_text, Job.description)
+                    .join(User, Application.candidate_id == User.id)
+                    .join(Job, Application.job_id == Job.id)
+                    .where(Application.job_id == job_id, User.email == self.email)
+                    .limit(1)
+                )
+                row = result.first()
             
-            if not application:
+            if not row:
                 return []
                 
-            job = db_session.query(Job).get(job_id)
             questions = self.ai_service.generate_interview_questions(
-                job.description,
-                application.resume_text
+                row.description,
+                row.resume_text
             )
             return questions
         except SQLAlchemyError as e:
@@ -132,7 +181,7 @@ class CandidateService:
             logger.error(f"Error starting interview: {e}")
             return []
     
-    def submit_interview_results(self, job_id: int, results: dict) -> bool:
+    async def submit_interview_results(self, job_id: int, results: dict) -> bool:
         """
         Save interview results to database.
         
@@ -144,52 +193,57 @@ class CandidateService:
             True if submission was successful, False otherwise
         """
         try:
-            application = db_session.query(Application).filter(
-                Application.job_id == job_id,
-                Application.candidate.has(email=self.email)
-            ).first()
-            
-            if not application:
-                return False
+            async with AsyncSessionLocal() as session:
+                application = await session.scalar(
+                    select(Application)
+                    .join(User, Application.candidate_id == User.id)
+                    .where(Application.job_id == job_id, User.email == self.email)
+                    .limit(1)
+                )
                 
-            # Create interview record
-            interview = Interview(
-                application_id=application.id,
-                score=results['score'],
-                total_questions=results['total'],
-                completed_at=datetime.utcnow(),
-                created_at=datetime.utcnow()
-            )
-            db_session.add(interview)
-            db_session.flush()  # Get interview ID
-            
-            # Add answers
-            for answer in results['answers']:
-                interview_answer = InterviewAnswer(
-                    interview_id=interview.id,
-                    question=answer['question'],
-                    answer=answer['answer'],
-                    is_correct=answer['correct'],
-                    difficulty=answer['difficulty'],
-                    created_at=datetime.utcnow()
+                if not application:
+                    return False
+                    
+                now = datetime.utcnow()
+                
+                # Create interview record
+                interview = Interview(
+                    application_id=application.id,
+                    score=results['score'],
+                    total_questions=results['total'],
+                    completed_at=now,
+                    created_at=now
                 )
-                db_session.add(interview_answer)
-            
-            # Update application status
-            application.status = "interviewed"
-            application.updated_at = datetime.utcnow()
-            
-            db_session.commit()
+                session.add(interview)
+                await session.flush()  # Get interview ID
+                
+                # Add answers as one multi-row INSERT
+                answers = [{
+                    'interview_id': interview.id,
+                    'question': answer['question'],
+                    'answer': answer['answer'],
+                    'is_correct': answer['correct'],
+                    'difficulty': answer['difficulty'],
+                    'created_at': now
+                } for answer in results['answers']]
+                if answers:
+                    await session.execute(insert(InterviewAnswer), answers)
+                
+                # Update application status
+                application.status = "interviewed"
+                application.updated_at = now
+                
+                await session.commit()
             return True
         except SQLAlchemyError as e:
-            db_session.rollback()
+            # Leaving the session block rolled back the transaction
             logger.error(f"Error saving interview results: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error saving interview results: {e}")
             return False
         
-    def get_my_applications(self) -> list[dict]:
+    async def get_my_applications(self) -> list[dict]:
         """
         Get all applications for the current candidate.
         
@@ -197,13 +251,18 @@ class CandidateService:
             List of dictionaries containing application details
         """
         try:
-            candidate = db_session.query(User).filter(User.email == self.email).first()
-            if not candidate:
-                return []
-                
-            applications = db_session.query(Application).filter(
-                Application.candidate_id == candidate.id
-            ).all()
+            # Load jobs and interviews up front instead of one query per application
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Application)
+                    .join(User, Application.candidate_id == User.id)
+                    .options(
+                        selectinload(Application.job),
+                        selectinload(Application.interview)
+                    )
+                    .where(User.email == self.email)
+                )
+                applications = result.scalars().all()
             
             return [{
                 'job_id': app.job.id,
@@ -1,28 +1,71 @@
+import asyncio
 import smtplib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from typing import List, Optional, Tuple
 from app.utils.config import config
 import logging
 
 logger = logging.getLogger(__name__)
 
 class EmailService:
+    """
+    Sends mail over one persistent SMTP connection.
+
+    The connection is opened on first use, probed with NOOP before each
+    send and reopened if the server has dropped it, so consecutive
+    notifications skip the TCP + STARTTLS + AUTH handshake.
+    """
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+        # Sends are serialized on the one connection, so one worker suffices
+        self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email")
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(config.EMAIL_HOST, config.EMAIL_PORT, timeout=30)
+        server.starttls()
+        server.login(config.EMAIL_USER, config.EMAIL_PASS)
+        return server
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return a live connection, reconnecting if the cached one is gone"""
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except smtplib.SMTPException:
+                pass
+            self._discard_connection()
+        self._server = self._connect()
+        return self._server
+
+    def _discard_connection(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+    def verify_connection(self) -> bool:
+        """Open (or probe) the SMTP connection, raising if the server is unreachable"""
+        with self._lock:
+            self._get_connection()
+        return True
+
     def send_email(self, recipient: str, subject: str, body: str) -> bool:
         if not config.EMAIL_USER or not config.EMAIL_PASS:
             logger.warning("Email credentials not configured")
             return False
             
         try:
-            msg = MIMEMultipart()
-            msg['From'] = config.EMAIL_USER
-            msg['To'] = recipient
-            msg['Subject'] = subject
-            msg.attach(MIMEText(body, 'plain'))
-
-            with smtplib.SMTP(config.EMAIL_HOST, config.EMAIL_PORT) as server:
-                server.starttls()
-                server.login(config.EMAIL_USER, config.EMAIL_PASS)
-                server.send_message(msg)
+            msg = self._build_message(recipient, subject, body)
+            with self._lock:
+                self._deliver(self._get_connection(), msg)
                 
             logger.info(f"Email sent to {recipient}: {subject}")
             return True
@@ -32,4 +75,81 @@ class EmailService:
             return False
         except Exception as e:
             logger.error(f"Error sending email: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def queue_email(self, recipient: str, subject: str, body: str) -> "Future[bool]":
+        """
+        send_email without waiting: the message goes out on a background
+        thread, in submission order, and the returned future holds the result.
+        """
+        return self._background.submit(self.send_email, recipient, subject, body)
+
+    def send_bulk(self, messages: List[Tuple[str, str, str]]) -> int:
+        """
+        Send (recipient, subject, body) emails back to back on the shared
+        connection, probing it once rather than before every message.
+        A failed message is logged and skipped. Returns how many were sent.
+        """
+        if not config.EMAIL_USER or not config.EMAIL_PASS:
+            logger.warning("Email credentials not configured")
+            return 0
+            
+        sent = 0
+        try:
+            with self._lock:
+                server = self._get_connection()
+                for recipient, subject, body in messages:
+                    try:
+                        server = self._deliver(server, self._build_message(recipient, subject, body))
+                        sent += 1
+                    except smtplib.SMTPAuthenticationError:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Error sending email to {recipient}: {e}")
+        except smtplib.SMTPAuthenticationError:
+            logger.error("SMTP Authentication Error: Check your email credentials.")
+        except Exception as e:
+            logger.error(f"Error sending emails: {e}")
+            
+        logger.info(f"Sent {sent} of {len(messages)} emails")
+        return sent
+
+    def _build_message(self, recipient: str, subject: str, body: str) -> MIMEMultipart:
+        msg = MIMEMultipart()
+        msg['From'] = config.EMAIL_USER
+        msg['To'] = recipient
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+
+    def _deliver(self, server: smtplib.SMTP, msg: MIMEMultipart) -> smtplib.SMTP:
+        """Send msg with the lock held; returns the connection to keep using"""
+        try:
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped since the last probe; retry once
+            self._discard_connection()
+            server = self._get_connection()
+            server.send_message(msg)
+        except smtplib.SMTPException:
+            # Clear the failed transaction so the connection stays reusable
+            server.rset()
+            raise
+        return server
+
+    async def send_email_async(self, recipient: str, subject: str, body: str) -> bool:
+        """send_email for coroutines; the blocking SMTP I/O runs in a worker thread"""
+        return await asyncio.to_thread(self.send_email, recipient, subject, body)
+
+    async def send_bulk_async(self, messages: List[Tuple[str, str, str]]) -> int:
+        """send_bulk for coroutines"""
+        return await asyncio.to_thread(self.send_bulk, messages)
+
+    def close(self):
+        """Close the persistent SMTP connection once queued emails have gone out"""
+        self._background.shutdown(wait=True)
+        with self._lock:
+            self._discard_connection()
+
+# Shared instance so every service reuses the same SMTP connection
+email_service = EmailService()
\ No newline at end of file
@@ -1,22 +1,60 @@
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from app.database.session import db_session
 from app.database.models import Job, User, Application, JobSkill
-from app.services.email_service import EmailService
-from app.services.ai_service import AIService
+from app.services.email_service import email_service
+from app.services.ai_service import get_ai_service
+from app.utils.config import settings
+from cachetools import TTLCache
 from datetime import datetime
-import uuid
+from functools import lru_cache
+from typing import Optional
+import threading
+
+# Candidate notification templates, filled with str.format
+_ACCEPT_SUBJECT = "Congratulations! You've been selected for {title}"
+_ACCEPT_BODY = (
+    "Dear {first_name},\n\n"
+    "We're pleased to inform you that you've been selected for the {title} position.\n\n"
+    "Best regards,\nRecruitment Team"
+)
+_REJECT_SUBJECT = "Regarding your application for {title}"
+_REJECT_BODY = (
+    "Dear {first_name},\n\n"
+    "Thank you for applying for the {title} position. "
+    "After careful consideration, we've decided to move forward with other candidates.\n\n"
+    "Best regards,\nRecruitment Team"
+)
+
+# get_my_jobs results per recruiter ID; cleared for a recruiter when they post.
+# Only called with _my_jobs_cache_lock held, so it is created exactly once
+@lru_cache(maxsize=1)
+def _my_jobs_cache() -> TTLCache:
+    return TTLCache(maxsize=256, ttl=settings.JOB_LIST_CACHE_TTL_SECONDS)
+
+_my_jobs_cache_lock = threading.Lock()
 
 class RecruiterService:
     def __init__(self, email: str):
         self.email = email
-        self.ai_service = AIService()
-        self.email_service = EmailService()
+        self.ai_service = get_ai_service()
+        self.email_service = email_service
+        self._recruiter_id: Optional[int] = None
+    
+    @property
+    def recruiter_id(self) -> Optional[int]:
+        """The recruiter's user ID, looked up once by email and then reused"""
+        if self._recruiter_id is None:
+            self._recruiter_id = db_session.query(User.id).filter(
+                User.email == self.email
+            ).scalar()
+        return self._recruiter_id
     
     def post_job(self, job_data: dict) -> tuple[bool, str]:
         try:
             # Get recruiter user
-            recruiter = db_session.query(User).filter(User.email == self.email).first()
-            if not recruiter:
+            recruiter_id = self.recruiter_id
+            if recruiter_id is None:
                 return False, "Recruiter not found"
             
             # Create new job
@@ -27,22 +65,25 @@ class RecruiterService:
                 description=job_data['description'],
                 salary_min=job_data['salary_min'],
                 salary_max=job_data['salary_max'],
-                creator_id=recruiter.id,
+                creator_id=recruiter_id,
                 status="pending"  # Needs admin approval
             )
             
             db_session.add(new_job)
             db_session.flush()  # To get the job ID
             
-            # Add skills
-            for skill in job_data['skills']:
-                job_skill = JobSkill(
-                    job_id=new_job.id,
-                    skill=skill.strip()
-                )
-                db_session.add(job_skill)
+            # Add skills as one multi-row INSERT, blanks and repeats dropped
+            skills = dict.fromkeys(s.strip() for s in job_data['skills'])
+            skills_payload = [
+                {'job_id': new_job.id, 'skill': skill}
+                for skill in skills if skill
+            ]
+            if skills_payload:
+                db_session.execute(insert(JobSkill), skills_payload)
             
             db_session.commit()
+            with _my_jobs_cache_lock:
+                _my_jobs_cache().pop(recruiter_id, None)
             return True, "Job posted successfully"
         except SQLAlchemyError as e:
             db_session.rollback()
@@ -52,12 +93,27 @@ class RecruiterService:
             return False, f"Error posting job: {str(e)}"
     
     def get_my_jobs(self) -> list[dict]:
-        recruiter = db_session.query(User).filter(User.email == self.email).first()
-        if not recruiter:
+        recruiter_id = self.recruiter_id
+        if recruiter_id is None:
             return []
+        
+        with _my_jobs_cache_lock:
+            cached = _my_jobs_cache().get(recruiter_id)
+        if cached is not None:
+            return cached
             
-        jobs = db_session.query(Job).filter(Job.creator_id == recruiter.id).all()
-        return [{
+        # Only the listed columns, not whole Job entities
+        jobs = db_session.query(
+            Job.id,
+            Job.title,
+            Job.department,
+            Job.location,
+            Job.status,
+            Job.created_at
+        ).filter(
+            Job.creator_id == recruiter_id
+        ).all()
+        my_jobs = [{
             'id': job.id,
             'title': job.title,
             'department': job.department,
@@ -65,16 +121,36 @@ class RecruiterService:
             'status': job.status,
             'created_at': job.created_at.strftime("%Y-%m-%d")
         } for job in jobs]
+        with _my_jobs_cache_lock:
+            _my_jobs_cache()[recruiter_id] = my_jobs
+        return my_jobs
     
     def get_job_candidates(self, job_id: int) -> list[dict]:
-        applications = db_session.query(Application).filter(Application.job_id == job_id).all()
+        # Candidate columns come from the same JOIN, not a lazy load per row
+        rows = db_session.query(
+            Application.match_score,
+            Application.resume_summary,
+            Application.status,
+            Application.created_at,
+            User.email,
+            User.first_name,
+            User.last_name
+        ).join(
+            User, Application.candidate_id == User.id
+        ).filter(
+            Application.job_id == job_id
+        ).order_by(
+            # Best matches first, sorted by the database rather than in Python
+            Application.match_score.desc().nulls_last()
+        ).all()
         return [{
-            'email': app.candidate.email,
-            'name': f"{app.candidate.first_name} {app.candidate.last_name}",
-            'match_score': app.match_score,
-            'status': app.status,
-            'applied_at': app.created_at.strftime("%Y-%m-%d")
-        } for app in applications]
+            'email': row.email,
+            'name': f"{row.first_name} {row.last_name}",
+            'match_score': row.match_score,
+            'resume_summary': row.resume_summary,
+            'status': row.status,
+            'applied_at': row.created_at.strftime("%Y-%m-%d")
+        } for row in rows]
     
     def get_candidate_details(self, job_id: int, candidate_email: str) -> dict:
         application = db_session.query(Application).join(User).filter(
@@ -95,25 +171,17 @@ class RecruiterService:
     
     def accept_candidate(self, job_id: int, candidate_email: str) -> bool:
         try:
-            application = db_session.query(Application).join(User).filter(
-                Application.job_id == job_id,
-                User.email == candidate_email
-            ).first()
-            
-            if not application:
+            found = self._update_application_status(job_id, candidate_email, "accepted")
+            if not found:
                 return False
-                
-            application.status = "accepted"
-            db_session.commit()
+            first_name, job_title = found
             
             # Send email notification
-            job = db_session.query(Job).get(job_id)
-            subject = f"Congratulations! You've been selected for {job.title}"
-            body = f"Dear {application.candidate.first_name},\n\n" \
-                   f"We're pleased to inform you that you've been selected for the {job.title} position.\n\n" \
-                   "Best regards,\nRecruitment Team"
+            subject = _ACCEPT_SUBJECT.format(title=job_title)
+            body = _ACCEPT_BODY.format(first_name=first_name, title=job_title)
             
-            self.email_service.send_email(
+            # Queued so the recruiter isn't kept waiting on SMTP
+            self.email_service.queue_email(
                 recipient=candidate_email,
                 subject=subject,
                 body=body
@@ -126,26 +194,17 @@ class RecruiterService:
     
     def reject_candidate(self, job_id: int, candidate_email: str) -> bool:
         try:
-            application = db_session.query(Application).join(User).filter(
-                Application.job_id == job_id,
-                User.email == candidate_email
-            ).first()
-            
-            if not application:
+            found = self._update_application_status(job_id, candidate_email, "rejected")
+            if not found:
                 return False
-                
-            application.status = "rejected"
-            db_session.commit()
+            first_name, job_title = found
             
             # Send email notification
-            job = db_session.query(Job).get(job_id)
-            subject = f"Regarding your application for {job.title}"
-            body = f"Dear {application.candidate.first_name},\n\n" \
-                   f"Thank you for applying for the {job.title} position. " \
-                   "After careful consideration, we've decided to move forward with other candidates.\n\n" \
-                   "Best regards,\nRecruitment Team"
+            subject = _REJECT_SUBJECT.format(title=job_title)
+            body = _REJECT_BODY.format(first_name=first_name, title=job_title)
             
-            self.email_service.send_email(
+            # Queued so the recruiter isn't kept waiting on SMTP
+            self.email_service.queue_email(
                 recipient=candidate_email,
                 subject=subject,
                 body=body
@@ -156,6 +215,34 @@ class RecruiterService:
             db_session.rollback()
             return False
     
+    def _update_application_status(
+        self,
+        job_id: int,
+        candidate_email: str,
+        status: str
+    ) -> Optional[tuple[str, str]]:
+        """
+        Set an application's status, loading what the notification needs in
+        the same query. Returns (candidate first name, job title), or None if
+        the candidate has not applied for the job.
+        """
+        row = db_session.query(Application, User.first_name, Job.title).join(
+            User, Application.candidate_id == User.id
+        ).join(
+            Job, Application.job_id == Job.id
+        ).filter(
+            Application.job_id == job_id,
+            User.email == candidate_email
+        ).first()
+        
+        if not row:
+            return None
+            
+        application, first_name, job_title = row
+        application.status = status
+        db_session.commit()
+        return first_name, job_title
+    
     def generate_ai_summary(self, job_id: int, candidate_email: str) -> str:
         application = db_session.query(Application).join(User).filter(
             Application.job_id == job_id,
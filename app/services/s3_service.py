@@ -2,7 +2,10 @@
 Enhanced S3 Service with Bucket Validation and Improved Error Handling
 """
 
+import asyncio
 import boto3
+import aioboto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import (
     ClientError,
     NoCredentialsError,
@@ -10,13 +13,107 @@ from botocore.exceptions import (
 )
 from app.utils.config import settings
 import logging
-import uuid
+import hashlib
 import os
-from typing import Tuple, Optional
+import threading
+from functools import lru_cache
+from cachetools import TLRUCache
+from contextlib import AsyncExitStack
+from types import MappingProxyType
+from typing import Dict, Final, FrozenSet, List, Mapping, Set, Tuple, Optional
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
 
+# Resumes over 5 MB go up as parallel 5 MB parts (S3's minimum part size);
+# smaller files are a single PUT as before
+RESUME_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+_CONTENT_TYPES: Final[Mapping[str, str]] = MappingProxyType({
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg'
+})
+
+@lru_cache(maxsize=1)
+def _allowed_extensions() -> FrozenSet[str]:
+    """Allowed upload extensions in splitext form (".pdf"); settings list them without the dot"""
+    return frozenset(
+        f".{ext.lstrip('.').lower()}" for ext in settings.ALLOWED_FILE_TYPES
+    )
+
+# Shared by the sync and async clients. Adaptive retries add client-side
+# rate limiting that backs off on throttling instead of retrying blindly.
+_BOTO_CONFIG = boto3.session.Config(
+    connect_timeout=5,
+    read_timeout=30,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    max_pool_connections=50
+)
+
+# Buckets already confirmed reachable in this process
+_validated_buckets: Set[str] = set()
+
+# S3 DeleteObjects accepts at most this many keys per request
+S3_DELETE_BATCH_SIZE = 1000
+
+# Presigned URLs keyed by (s3_key, expires_in), dropped PRESIGN_SLACK_SECONDS
+# before they expire so a cached URL always has some life left
+PRESIGN_SLACK_SECONDS = 300
+_presigned_urls = TLRUCache(
+    maxsize=1024,
+    ttu=lambda key, url, now: now + max(key[1] - PRESIGN_SLACK_SECONDS, 0)
+)
+_presigned_urls_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_s3_client():
+    """
+    Process-wide boto3 client. Clients are thread-safe and costly to build
+    (credential chain, endpoint resolution, TLS pool), so one is shared.
+    """
+    s3 = boto3.client(
+        's3',
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+        config=_BOTO_CONFIG
+    )
+    # Verify credentials work
+    s3.list_buckets()
+    return s3
+
+_async_s3_client = None
+_async_s3_client_lock = asyncio.Lock()
+_async_s3_client_stack = AsyncExitStack()
+
+async def _get_async_s3_client():
+    """Process-wide aioboto3 client, opened on first use and kept for its connection pool"""
+    global _async_s3_client
+    if _async_s3_client is None:
+        async with _async_s3_client_lock:
+            if _async_s3_client is None:
+                session = aioboto3.Session(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_REGION
+                )
+                _async_s3_client = await _async_s3_client_stack.enter_async_context(
+                    session.client(
+                        's3',
+                        config=_BOTO_CONFIG
+                    )
+                )
+    return _async_s3_client
+
 class S3Service:
     def __init__(self):
         """
@@ -28,19 +125,7 @@ class S3Service:
     def _initialize_client(self):
         """Initialize S3 client with retry logic"""
         try:
-            self.s3 = boto3.client(
-                's3',
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION,
-                config=boto3.session.Config(
-                    connect_timeout=5,
-                    read_timeout=30,
-                    retries={'max_attempts': 3}
-                )
-            )
-            # Verify credentials work
-            self.s3.list_buckets()
+            self.s3 = _get_s3_client()
         except NoCredentialsError:
             logger.error("AWS credentials not found")
             raise
@@ -50,11 +135,16 @@ class S3Service:
 
     def _validate_bucket(self):
         """Validate bucket exists and is accessible"""
+        if settings.S3_BUCKET_NAME in _validated_buckets:
+            self.bucket = settings.S3_BUCKET_NAME
+            return
+            
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 self.s3.head_bucket(Bucket=settings.S3_BUCKET_NAME)
                 self.bucket = settings.S3_BUCKET_NAME
+                _validated_buckets.add(self.bucket)
                 logger.info(f"Successfully connected to S3 bucket: {self.bucket}")
                 return
             except ClientError as e:
@@ -92,39 +182,63 @@ class S3Service:
             Tuple of (success: bool, s3_key: Optional[str])
         """
         try:
-            # Validate file exists and is readable
-            if not os.path.isfile(file_path):
-                logger.error(f"File not found: {file_path}")
-                return False, None
-                
-            if not os.access(file_path, os.R_OK):
-                logger.error(f"File not readable: {file_path}")
-                return False, None
-
-            # Generate unique filename
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext not in settings.ALLOWED_FILE_TYPES:
-                logger.error(f"Invalid file extension: {ext}")
+            prepared = self._prepare_resume_upload(file_path, user_email)
+            if not prepared:
                 return False, None
-                
-            filename = f"resumes/{user_email}/{uuid.uuid4()}{ext}"
+            filename, extra_args = prepared
+            
+            # Content-addressed key: the same file was already uploaded
+            if self._resume_exists(filename):
+                return True, filename
             
-            # Upload file with metadata
+            # upload_file raises if the PUT fails, and S3 rejects the object
+            # if its CRC32 doesn't match, so no follow-up HEAD is needed to
+            # confirm it arrived intact
             self.s3.upload_file(
-                file_path,
-                self.bucket,
-                filename,
-                ExtraArgs={
-                    'ContentType': self._get_content_type(ext),
-                    'Metadata': {
-                        'uploaded-by': user_email,
-                        'original-filename': os.path.basename(file_path)
-                    }
-                }
+                file_path, self.bucket, filename,
+                ExtraArgs=extra_args,
+                Config=RESUME_TRANSFER_CONFIG
             )
             
-            # Verify upload succeeded
-            self.s3.head_object(Bucket=self.bucket, Key=filename)
+            return True, filename
+            
+        except ClientError as e:
+            logger.error(f"S3 upload error: {str(e)}")
+            return False, str(e)
+        except Exception as e:
+            logger.error(f"Unexpected upload error: {str(e)}")
+            return False, str(e)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((ClientError, EndpointConnectionError)),
+        reraise=True
+    )
+    async def upload_resume_async(self, file_path: str, user_email: str) -> Tuple[bool, Optional[str]]:
+        """
+        upload_resume for coroutines, on aioboto3's non-blocking client so
+        concurrent uploads overlap on the event loop instead of each holding
+        a thread for the whole PUT
+        
+        Returns:
+            Tuple of (success: bool, s3_key: Optional[str])
+        """
+        try:
+            prepared = await asyncio.to_thread(self._prepare_resume_upload, file_path, user_email)
+            if not prepared:
+                return False, None
+            filename, extra_args = prepared
+            
+            s3 = await _get_async_s3_client()
+            if await self._resume_exists_async(s3, filename):
+                return True, filename
+            with open(file_path, 'rb') as f:
+                await s3.upload_fileobj(
+                    f, self.bucket, filename,
+                    ExtraArgs=extra_args,
+                    Config=RESUME_TRANSFER_CONFIG
+                )
             
             return True, filename
             
@@ -135,16 +249,68 @@ class S3Service:
             logger.error(f"Unexpected upload error: {str(e)}")
             return False, str(e)
 
+    def _prepare_resume_upload(self, file_path: str, user_email: str) -> Optional[Tuple[str, Dict]]:
+        """Validate a resume file; returns its new S3 key and upload ExtraArgs, or None"""
+        # Validate file exists and is readable
+        if not os.path.isfile(file_path):
+            logger.error(f"File not found: {file_path}")
+            return None
+            
+        if not os.access(file_path, os.R_OK):
+            logger.error(f"File not readable: {file_path}")
+            return None
+
+        # Generate unique filename
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in _allowed_extensions():
+            logger.error(f"Invalid file extension: {ext}")
+            return None
+            
+        # Keyed by content so re-uploading the same file is detectable; the
+        # object is then shared by every application that submitted it
+        filename = f"resumes/{user_email}/{self._file_sha256(file_path)}{ext}"
+        
+        # Upload file with metadata
+        extra_args = {
+            'ContentType': self._get_content_type(ext),
+            'ChecksumAlgorithm': 'CRC32',
+            'Metadata': {
+                'uploaded-by': user_email,
+                'original-filename': os.path.basename(file_path)
+            }
+        }
+        return filename, extra_args
+
+    @staticmethod
+    def _file_sha256(file_path: str) -> str:
+        """Hex SHA-256 of a file, read in 1 MB chunks"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _resume_exists(self, s3_key: str) -> bool:
+        try:
+            self.s3.head_object(Bucket=self.bucket, Key=s3_key)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    async def _resume_exists_async(self, s3, s3_key: str) -> bool:
+        try:
+            await s3.head_object(Bucket=self.bucket, Key=s3_key)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
     def _get_content_type(self, ext: str) -> str:
         """Map file extension to content type"""
-        return {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg'
-        }.get(ext, 'application/octet-stream')
+        return _CONTENT_TYPES.get(ext, 'application/octet-stream')
 
     @retry(
         stop=stop_after_attempt(3),
@@ -163,11 +329,16 @@ class S3Service:
         Returns:
             Presigned URL or None if failed
         """
-        try:
-            # Validate object exists first
-            self.s3.head_object(Bucket=self.bucket, Key=s3_key)
+        cache_key = (s3_key, expires_in)
+        with _presigned_urls_lock:
+            url = _presigned_urls.get(cache_key)
+        if url:
+            return url
             
-            return self.s3.generate_presigned_url(
+        try:
+            # No head_object pre-flight: a URL for a missing key simply
+            # 404s when it is opened
+            url = self.s3.generate_presigned_url(
                 'get_object',
                 Params={
                     'Bucket': self.bucket,
@@ -176,6 +347,9 @@ class S3Service:
                 },
                 ExpiresIn=expires_in
             )
+            with _presigned_urls_lock:
+                _presigned_urls[cache_key] = url
+            return url
         except ClientError as e:
             logger.error(f"S3 URL generation error: {str(e)}")
             return None
@@ -193,6 +367,11 @@ class S3Service:
         """
         Delete resume from S3
         
+        Resume keys are content-addressed (resumes/<email>/<sha256><ext>),
+        so every application where a user submitted the same file points at
+        the same object. Callers must check that no other application's
+        resume_s3_key still references the key before deleting it.
+        
         Args:
             s3_key: S3 object key
             
@@ -201,10 +380,64 @@ class S3Service:
         """
         try:
             self.s3.delete_object(Bucket=self.bucket, Key=s3_key)
+            self._forget_presigned_urls([s3_key])
             return True
         except ClientError as e:
             logger.error(f"S3 delete error: {str(e)}")
             return False
         except Exception as e:
             logger.error(f"Unexpected delete error: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    def delete_resumes(self, s3_keys: List[str]) -> Dict[str, bool]:
+        """
+        Delete many resumes with one DeleteObjects request per 1000 keys
+        
+        Keys may be shared between applications; see delete_resume.
+        
+        Args:
+            s3_keys: S3 object keys
+            
+        Returns:
+            Mapping of each key to whether it was deleted
+        """
+        results = {key: True for key in s3_keys}
+        keys = list(results)
+        for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+            batch = keys[start:start + S3_DELETE_BATCH_SIZE]
+            try:
+                # Quiet mode only reports the keys that failed
+                response = self.s3.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                for error in response.get('Errors', []):
+                    logger.error(f"S3 delete error for {error.get('Key')}: {error.get('Message')}")
+                    results[error['Key']] = False
+            except Exception as e:
+                logger.error(f"S3 bulk delete error: {str(e)}")
+                results.update(dict.fromkeys(batch, False))
+        
+        self._forget_presigned_urls(key for key, deleted in results.items() if deleted)
+        return results
+
+    @staticmethod
+    def _forget_presigned_urls(s3_keys):
+        """Drop cached presigned URLs for deleted objects"""
+        deleted = set(s3_keys)
+        with _presigned_urls_lock:
+            for cache_key in [k for k in _presigned_urls.keys() if k[0] in deleted]:
+                _presigned_urls.pop(cache_key, None)
+
+# Lazily created singleton - nothing connects until the first get_s3_service() call
+_s3_service: Optional[S3Service] = None
+_s3_service_lock = threading.Lock()
+
+def get_s3_service() -> S3Service:
+    """Return the shared S3Service so the boto3 client and bucket check happen once"""
+    global _s3_service
+    if _s3_service is None:
+        with _s3_service_lock:
+            if _s3_service is None:
+                _s3_service = S3Service()
+    return _s3_service
@@ -1,10 +1,105 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QMessageBox, QHeaderView
+    QWidget, QVBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem, QTableView,
+    QPushButton, QLabel, QMessageBox, QHeaderView, QApplication,
+    QStyledItemDelegate, QStyle, QStyleOptionButton
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QEvent, QRect, QAbstractTableModel, QModelIndex, pyqtSignal
+from contextlib import contextmanager
+from fastapi import HTTPException
+from qasync import asyncSlot
 from app.services.admin_service import AdminService
 
+# Rows fetched per "Load more" click
+ADMIN_PAGE_SIZE = 50
+
+@contextmanager
+def _batch_update(table: QTableWidget):
+    """Suspend repaints, sorting and signals while a table is repopulated, then refresh once"""
+    sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(False)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+
+def _action_item(row_id) -> QTableWidgetItem:
+    """Non-editable cell for an action column, carrying the row's id for the delegate's handler"""
+    item = QTableWidgetItem()
+    item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+    item.setData(Qt.ItemDataRole.UserRole, row_id)
+    return item
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a row of push buttons into every cell of one column and reports
+    clicks as (row, action index), so a table needs no per-row widgets
+    """
+    action_clicked = pyqtSignal(int, int)  # row, index into labels
+    
+    def __init__(self, labels, parent=None):
+        super().__init__(parent)
+        self.labels = labels
+    
+    def _button_rects(self, rect: QRect):
+        width = rect.width() // len(self.labels)
+        return [
+            QRect(rect.x() + i * width, rect.y(), width, rect.height()).adjusted(2, 2, -2, -2)
+            for i in range(len(self.labels))
+        ]
+    
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        for label, rect in zip(self.labels, self._button_rects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            pos = event.position().toPoint()
+            for action, rect in enumerate(self._button_rects(option.rect)):
+                if rect.contains(pos):
+                    self.action_clicked.emit(index.row(), action)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+class ActivityModel(QAbstractTableModel):
+    """Serves the recent-activity feed straight from the stats list, cell by cell as it is painted"""
+    COLUMNS = ("timestamp", "user", "action")
+    HEADERS = ("Timestamp", "User", "Action")
+    
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows or []
+    
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return str(self._rows[index.row()].get(self.COLUMNS[index.column()], ""))
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
 class AdminDashboard(QWidget):
     def __init__(self, email: str):
         super().__init__()
@@ -36,6 +131,21 @@ class AdminDashboard(QWidget):
         
         layout.addWidget(self.tabs)
         self.setLayout(layout)
+        
+        # Each tab fetches its data when first opened, not all at construction
+        self._tab_loaders = {
+            self.users_tab: self.load_users,
+            self.jobs_tab: self.load_jobs,
+            self.monitor_tab: self.load_stats
+        }
+        self.tabs.currentChanged.connect(self._lazy_load_tab)
+        self._lazy_load_tab(self.tabs.currentIndex())
+    
+    def _lazy_load_tab(self, index: int):
+        """Run a tab's initial load the first time it is shown"""
+        loader = self._tab_loaders.pop(self.tabs.widget(index), None)
+        if loader:
+            loader()
     
     def init_users_tab(self):
         layout = QVBoxLayout()
@@ -46,16 +156,23 @@ class AdminDashboard(QWidget):
         self.user_table.setHorizontalHeaderLabels(["ID", "Email", "Role", "Status", "Actions"])
         self.user_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.user_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.user_actions = ActionButtonDelegate(["Toggle Status", "Delete"], self.user_table)
+        self.user_actions.action_clicked.connect(self._on_user_action)
+        self.user_table.setItemDelegateForColumn(4, self.user_actions)
         
         # Refresh button
         refresh_btn = QPushButton("Refresh Users")
         refresh_btn.clicked.connect(self.load_users)
         
+        self.more_users_btn = QPushButton("Load More Users")
+        self.more_users_btn.clicked.connect(self.load_more_users)
+        self._user_cursor = None
+        
         layout.addWidget(self.user_table)
+        layout.addWidget(self.more_users_btn)
         layout.addWidget(refresh_btn)
         
         self.users_tab.setLayout(layout)
-        self.load_users()
     
     def init_jobs_tab(self):
         layout = QVBoxLayout()
@@ -66,119 +183,167 @@ class AdminDashboard(QWidget):
         self.jobs_table.setHorizontalHeaderLabels(["ID", "Title", "Department", "Status", "Poster", "Actions"])
         self.jobs_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.jobs_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.job_actions = ActionButtonDelegate(["Approve", "Reject"], self.jobs_table)
+        self.job_actions.action_clicked.connect(self._on_job_action)
+        self.jobs_table.setItemDelegateForColumn(5, self.job_actions)
         
         # Refresh button
         refresh_btn = QPushButton("Refresh Jobs")
         refresh_btn.clicked.connect(self.load_jobs)
         
+        self.more_jobs_btn = QPushButton("Load More Jobs")
+        self.more_jobs_btn.clicked.connect(self.load_more_jobs)
+        self._jobs_page = 1
+        
         layout.addWidget(self.jobs_table)
+        layout.addWidget(self.more_jobs_btn)
         layout.addWidget(refresh_btn)
         
         self.jobs_tab.setLayout(layout)
-        self.load_jobs()
     
     def init_monitor_tab(self):
         layout = QVBoxLayout()
         
-        # System stats
-        stats = self.admin_service.get_system_stats()
-        
         # Active users
-        active_users_label = QLabel(f"Active Users: {stats['active_users']}")
+        self.active_users_label = QLabel("Active Users: ...")
         
         # Pending jobs
-        pending_jobs_label = QLabel(f"Pending Jobs: {stats['pending_jobs']}")
-        
-        # Storage usage
-        storage_label = QLabel(f"Storage Used: {stats['storage_used']} MB")
+        self.pending_jobs_label = QLabel("Pending Jobs: ...")
         
         # Recent activity
         activity_label = QLabel("Recent Activity:")
-        self.activity_list = QTableWidget()
-        self.activity_list.setColumnCount(3)
-        self.activity_list.setHorizontalHeaderLabels(["Timestamp", "User", "Action"])
+        self.activity_model = ActivityModel(parent=self)
+        self.activity_list = QTableView()
+        self.activity_list.setModel(self.activity_model)
         self.activity_list.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         
-        # Add recent activities
-        self.activity_list.setRowCount(len(stats['recent_activity']))
-        for i, activity in enumerate(stats['recent_activity']):
-            self.activity_list.setItem(i, 0, QTableWidgetItem(activity['timestamp']))
-            self.activity_list.setItem(i, 1, QTableWidgetItem(activity['user']))
-            self.activity_list.setItem(i, 2, QTableWidgetItem(activity['action']))
-        
-        layout.addWidget(active_users_label)
-        layout.addWidget(pending_jobs_label)
-        layout.addWidget(storage_label)
+        layout.addWidget(self.active_users_label)
+        layout.addWidget(self.pending_jobs_label)
         layout.addWidget(activity_label)
         layout.addWidget(self.activity_list)
         
         self.monitor_tab.setLayout(layout)
     
-    def load_users(self):
-        users = self.admin_service.get_all_users()
-        self.user_table.setRowCount(len(users))
+    @asyncSlot()
+    async def load_stats(self):
+        stats = await self.admin_service.get_system_stats()
+        self.active_users_label.setText(f"Active Users: {stats['users']['active']}")
+        self.pending_jobs_label.setText(f"Pending Jobs: {stats['jobs']['pending']}")
+        
+        # Add recent activities
+        self.activity_model.set_rows(stats.get('recent_activity', []))
+    
+    @asyncSlot()
+    async def load_users(self):
+        result = await self.admin_service.get_all_users(per_page=ADMIN_PAGE_SIZE)
+        self._user_cursor = result['next_cursor']
+        self.more_users_btn.setEnabled(self._user_cursor is not None)
+        with _batch_update(self.user_table):
+            self.user_table.setRowCount(0)
+            self._populate_users(result['data'])
+    
+    @asyncSlot()
+    async def load_more_users(self):
+        if self._user_cursor is None:
+            return
+        result = await self.admin_service.get_all_users(
+            per_page=ADMIN_PAGE_SIZE, after_id=self._user_cursor
+        )
+        self._user_cursor = result['next_cursor']
+        self.more_users_btn.setEnabled(self._user_cursor is not None)
+        with _batch_update(self.user_table):
+            self._populate_users(result['data'])
+    
+    def _populate_users(self, users):
+        """Append users below the rows already in the table"""
+        start = self.user_table.rowCount()
+        self.user_table.setRowCount(start + len(users))
+        rows = [
+            (
+                QTableWidgetItem(str(user['id'])),
+                QTableWidgetItem(user['email']),
+                QTableWidgetItem(user['role']),
+                QTableWidgetItem("Active" if user['is_active'] else "Inactive")
+            )
+            for user in users
+        ]
         
-        for i, user in enumerate(users):
-            self.user_table.setItem(i, 0, QTableWidgetItem(str(user['id'])))
-            self.user_table.setItem(i, 1, QTableWidgetItem(user['email']))
-            self.user_table.setItem(i, 2, QTableWidgetItem(user['role']))
+        for i, (user, (id_item, email_item, role_item, status_item)) in enumerate(zip(users, rows), start):
+            self.user_table.setItem(i, 0, id_item)
+            self.user_table.setItem(i, 1, email_item)
+            self.user_table.setItem(i, 2, role_item)
             
-            status_item = QTableWidgetItem("Active" if user['is_active'] else "Inactive")
             status_item.setFlags(status_item.flags() ^ Qt.ItemFlag.ItemIsEditable)
             self.user_table.setItem(i, 3, status_item)
             
-            # Add action buttons
-            action_widget = QWidget()
-            action_layout = QHBoxLayout()
-            
-            toggle_btn = QPushButton("Toggle Status")
-            toggle_btn.clicked.connect(lambda _, u=user: self.toggle_user_status(u['id']))
-            
-            delete_btn = QPushButton("Delete")
-            delete_btn.clicked.connect(lambda _, u=user: self.delete_user(u['id']))
-            
-            action_layout.addWidget(toggle_btn)
-            action_layout.addWidget(delete_btn)
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            
-            action_widget.setLayout(action_layout)
-            self.user_table.setCellWidget(i, 4, action_widget)
-    
-    def load_jobs(self):
-        jobs = self.admin_service.get_pending_jobs()
-        self.jobs_table.setRowCount(len(jobs))
-        
-        for i, job in enumerate(jobs):
-            self.jobs_table.setItem(i, 0, QTableWidgetItem(str(job['id'])))
-            self.jobs_table.setItem(i, 1, QTableWidgetItem(job['title']))
-            self.jobs_table.setItem(i, 2, QTableWidgetItem(job['department']))
-            self.jobs_table.setItem(i, 3, QTableWidgetItem(job['status']))
-            self.jobs_table.setItem(i, 4, QTableWidgetItem(job['poster_email']))
-            
-            # Add action buttons
-            action_widget = QWidget()
-            action_layout = QHBoxLayout()
-            
-            approve_btn = QPushButton("Approve")
-            approve_btn.clicked.connect(lambda _, j=job: self.approve_job(j['id']))
-            
-            reject_btn = QPushButton("Reject")
-            reject_btn.clicked.connect(lambda _, j=job: self.reject_job(j['id']))
-            
-            action_layout.addWidget(approve_btn)
-            action_layout.addWidget(reject_btn)
-            action_layout.setContentsMargins(0, 0, 0, 0)
+            # Buttons are painted by self.user_actions
+            self.user_table.setItem(i, 4, _action_item(user['id']))
+    
+    def _on_user_action(self, row: int, action: int):
+        user_id = self.user_table.item(row, 4).data(Qt.ItemDataRole.UserRole)
+        if action == 0:
+            self.toggle_user_status(user_id)
+        else:
+            self.delete_user(user_id)
+    
+    @asyncSlot()
+    async def load_jobs(self):
+        self._jobs_page = 1
+        result = await self.admin_service.get_pending_jobs(per_page=ADMIN_PAGE_SIZE)
+        with _batch_update(self.jobs_table):
+            self.jobs_table.setRowCount(0)
+            self._populate_jobs(result['data'])
+        self.more_jobs_btn.setEnabled(self.jobs_table.rowCount() < result['total'])
+    
+    @asyncSlot()
+    async def load_more_jobs(self):
+        result = await self.admin_service.get_pending_jobs(
+            page=self._jobs_page + 1, per_page=ADMIN_PAGE_SIZE
+        )
+        self._jobs_page += 1
+        with _batch_update(self.jobs_table):
+            self._populate_jobs(result['data'])
+        self.more_jobs_btn.setEnabled(self.jobs_table.rowCount() < result['total'])
+    
+    def _populate_jobs(self, jobs):
+        """Append jobs below the rows already in the table"""
+        start = self.jobs_table.rowCount()
+        self.jobs_table.setRowCount(start + len(jobs))
+        rows = [
+            [
+                QTableWidgetItem(str(job['id'])),
+                QTableWidgetItem(job['title']),
+                QTableWidgetItem(job['department']),
+                QTableWidgetItem(job['status']),
+                QTableWidgetItem(job['creator_email'])
+            ]
+            for job in jobs
+        ]
+        
+        for i, (job, items) in enumerate(zip(jobs, rows), start):
+            for col, item in enumerate(items):
+                self.jobs_table.setItem(i, col, item)
             
-            action_widget.setLayout(action_layout)
-            self.jobs_table.setCellWidget(i, 5, action_widget)
+            # Buttons are painted by self.job_actions
+            self.jobs_table.setItem(i, 5, _action_item(job['id']))
     
-    def toggle_user_status(self, user_id: int):
-        success, message = self.admin_service.toggle_user_status(user_id)
-        if success:
-            QMessageBox.information(self, "Success", message)
-            self.load_users()
+    def _on_job_action(self, row: int, action: int):
+        job_id = self.jobs_table.item(row, 5).data(Qt.ItemDataRole.UserRole)
+        if action == 0:
+            self.approve_job(job_id)
         else:
-            QMessageBox.critical(self, "Error", message)
+            self.reject_job(job_id)
+    
+    @asyncSlot()
+    async def toggle_user_status(self, user_id: str):
+        try:
+            result = await self.admin_service.toggle_user_status(user_id)
+        except HTTPException as e:
+            QMessageBox.critical(self, "Error", e.detail)
+            return
+        status = "activated" if result['new_status'] else "deactivated"
+        QMessageBox.information(self, "Success", f"User {status}")
+        self.load_users()
     
     def delete_user(self, user_id: int):
         confirm = QMessageBox.question(
@@ -195,13 +360,15 @@ class AdminDashboard(QWidget):
             else:
                 QMessageBox.critical(self, "Error", message)
     
-    def approve_job(self, job_id: int):
-        success, message = self.admin_service.approve_job(job_id)
-        if success:
-            QMessageBox.information(self, "Success", message)
-            self.load_jobs()
-        else:
-            QMessageBox.critical(self, "Error", message)
+    @asyncSlot()
+    async def approve_job(self, job_id: str):
+        try:
+            await self.admin_service.approve_job(job_id)
+        except HTTPException as e:
+            QMessageBox.critical(self, "Error", e.detail)
+            return
+        QMessageBox.information(self, "Success", "Job approved")
+        self.load_jobs()
     
     def reject_job(self, job_id: int):
         success, message = self.admin_service.reject_job(job_id)
@@ -1,17 +1,35 @@
+import html
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QTabWidget, QTextEdit, QFileDialog,
-    QListWidget, QStackedWidget
+    QPushButton, QTabWidget, QScrollArea, QFileDialog,
+    QListView, QStackedWidget
 )
 from PyQt6.QtCore import Qt
+from qasync import asyncSlot
 from app.services.candidate_service import CandidateService
+from app.ui.list_model import RecordListModel
 from app.ui.main_window import MainWindow
 
+# Job details pane, filled with str.format_map
+_JOB_DETAILS_HTML = """
+        <h2>{title}</h2>
+        <p><b>Department:</b> {department}</p>
+        <p><b>Location:</b> {location}</p>
+        <p><b>Salary Range:</b> ${salary_min:,} - ${salary_max:,}</p>
+        <h3>Description:</h3>
+        <p>{description}</p>
+        <h3>Required Skills:</h3>
+        <ul>
+        {skills_html}
+        </ul>
+        """
+
 class CandidateDashboard(QWidget):
     def __init__(self, email: str):
         super().__init__()
         self.email = email
         self.candidate_service = CandidateService(email)
+        self._job_html_cache: dict[int, str] = {}  # rendered details per job id
         self.init_ui()
         
     def init_ui(self):
@@ -38,28 +56,51 @@ class CandidateDashboard(QWidget):
         
         layout.addWidget(self.tabs)
         self.setLayout(layout)
+        
+        # Each tab fetches its data when first opened, not all at construction
+        self._tab_loaders = {self.jobs_tab: self.load_jobs, self.interviews_tab: self.load_interviews}
+        self.tabs.currentChanged.connect(self._lazy_load_tab)
+        self._lazy_load_tab(self.tabs.currentIndex())
+    
+    def _lazy_load_tab(self, index: int):
+        """Run a tab's initial load the first time it is shown"""
+        loader = self._tab_loaders.pop(self.tabs.widget(index), None)
+        if loader:
+            loader()
     
     def init_jobs_tab(self):
         layout = QVBoxLayout()
         
         # Job list
-        self.job_list = QListWidget()
-        self.job_list.itemClicked.connect(self.show_job_details)
-        
-        # Job details
-        self.job_details = QTextEdit()
-        self.job_details.setReadOnly(True)
+        self.job_model = RecordListModel(lambda job: f"{job['title']} - {job['department']}", self)
+        self.job_list = QListView()
+        self.job_list.setUniformItemSizes(True)
+        self.job_list.setModel(self.job_model)
+        self.job_list.clicked.connect(self.show_job_details)
+        
+        # Job details - static rich text, so a label rather than a text editor
+        self.job_details = QLabel()
+        self.job_details.setTextFormat(Qt.TextFormat.RichText)
+        self.job_details.setWordWrap(True)
+        self.job_details.setAlignment(Qt.AlignmentFlag.AlignTop)
+        job_details_scroll = QScrollArea()
+        job_details_scroll.setWidgetResizable(True)
+        job_details_scroll.setWidget(self.job_details)
         
         # Apply section
         self.resume_upload = QPushButton("Upload Resume")
         self.resume_upload.clicked.connect(self.upload_resume)
+        # Reused across clicks, which also keeps the last-used directory
+        self._file_dialog = QFileDialog(self, "Select Resume")
+        self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        self._file_dialog.setNameFilter("Documents (*.pdf *.docx);;Images (*.png *.jpg)")
         self.apply_btn = QPushButton("Apply")
         self.apply_btn.clicked.connect(self.apply_for_job)
         
         # Layout
         split_layout = QHBoxLayout()
         split_layout.addWidget(self.job_list, 1)
-        split_layout.addWidget(self.job_details, 2)
+        split_layout.addWidget(job_details_scroll, 2)
         
         layout.addLayout(split_layout)
         
@@ -70,9 +111,6 @@ class CandidateDashboard(QWidget):
         layout.addLayout(button_layout)
         
         self.jobs_tab.setLayout(layout)
-        
-        # Load jobs
-        self.load_jobs()
     
     def init_applications_tab(self):
         # Similar implementation for applications tab
@@ -82,50 +120,39 @@ class CandidateDashboard(QWidget):
         # Similar implementation for interviews tab
         pass
     
-    def load_jobs(self):
-        jobs = self.candidate_service.get_available_jobs()
-        self.job_list.clear()
-        for job in jobs:
-            self.job_list.addItem(f"{job['title']} - {job['department']}")
+    @asyncSlot()
+    async def load_jobs(self):
+        jobs = await self.candidate_service.get_available_jobs()
+        # The model keeps each whole job, so selecting one needs no lookup
+        self.job_model.set_rows(jobs)
+        self._job_html_cache.clear()
     
-    def show_job_details(self, item):
-        job_title = item.text().split(" - ")[0]
-        job = self.candidate_service.get_job_details(job_title)
-        
-        details = f"""
-        <h2>{job['title']}</h2>
-        <p><b>Department:</b> {job['department']}</p>
-        <p><b>Location:</b> {job['location']}</p>
-        <p><b>Salary Range:</b> ${job['salary_min']:,} - ${job['salary_max']:,}</p>
-        <h3>Description:</h3>
-        <p>{job['description']}</p>
-        <h3>Required Skills:</h3>
-        <ul>
-        {"".join(f"<li>{skill}</li>" for skill in job['skills'])}
-        </ul>
-        """
-        self.job_details.setHtml(details)
+    def show_job_details(self, index):
+        job = self.job_model.record(index)
+        if not job:
+            return
+        
+        details = self._job_html_cache.get(job['id'])
+        if details is None:
+            skills_html = "".join(f"<li>{html.escape(skill)}</li>" for skill in job['skills'])
+            details = _JOB_DETAILS_HTML.format_map({**job, 'skills_html': skills_html})
+            self._job_html_cache[job['id']] = details
+        self.job_details.setText(details)
     
     def upload_resume(self):
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(
-            self, "Select Resume", "", 
-            "Documents (*.pdf *.docx);;Images (*.png *.jpg)"
-        )
-        
-        if file_path:
-            self.current_resume_path = file_path
+        if self._file_dialog.exec():
+            self.current_resume_path = self._file_dialog.selectedFiles()[0]
     
-    def apply_for_job(self):
-        selected_item = self.job_list.currentItem()
-        if not selected_item:
+    @asyncSlot()
+    async def apply_for_job(self):
+        job = self.job_model.record(self.job_list.currentIndex())
+        if not job:
             return
             
         if not hasattr(self, 'current_resume_path'):
             return
             
-        job_title = selected_item.text().split(" - ")[0]
-        success = self.candidate_service.apply_for_job(job_title, self.current_resume_path)
+        success = await self.candidate_service.apply_for_job(job['id'], self.current_resume_path)
         
         if success:
             # Show success message
@@ -138,8 +165,13 @@ class CandidateDashboard(QWidget):
         layout = QVBoxLayout()
         
         # Pending interviews list
-        self.interview_list = QListWidget()
-        self.interview_list.itemClicked.connect(self.select_interview)
+        self.interview_model = RecordListModel(
+            lambda interview: f"{interview['job_title']} - {interview['department']}", self
+        )
+        self.interview_list = QListView()
+        self.interview_list.setUniformItemSizes(True)
+        self.interview_list.setModel(self.interview_model)
+        self.interview_list.clicked.connect(self.select_interview)
         
         # Start interview button
         self.start_interview_btn = QPushButton("Start Interview")
@@ -157,36 +189,42 @@ class CandidateDashboard(QWidget):
         layout.addWidget(self.results_label)
         
         self.interviews_tab.setLayout(layout)
-        self.load_interviews()
     
     def load_interviews(self):
         interviews = self.candidate_service.get_pending_interviews()
-        self.interview_list.clear()
-        
-        for interview in interviews:
-            item = QListWidgetItem(f"{interview['job_title']} - {interview['department']}")
-            item.setData(Qt.ItemDataRole.UserRole, interview['job_id'])
-            self.interview_list.addItem(item)
+        self.interview_model.set_rows(interviews)
     
-    def select_interview(self, item):
-        self.selected_job_id = item.data(Qt.ItemDataRole.UserRole)
+    def select_interview(self, index):
+        interview = self.interview_model.record(index)
+        if not interview:
+            return
+        self.selected_job_id = interview['job_id']
         self.start_interview_btn.setEnabled(True)
     
-    def start_interview(self):
+    @asyncSlot()
+    async def start_interview(self):
         if not hasattr(self, 'selected_job_id'):
             return
             
-        questions = self.candidate_service.start_interview(self.selected_job_id)
+        # Question generation waits on the AI backend; show that it is working
+        self.start_interview_btn.setEnabled(False)
+        self.results_label.setText("Generating interview questions...")
+        try:
+            questions = await self.candidate_service.start_interview(self.selected_job_id)
+        finally:
+            self.start_interview_btn.setEnabled(True)
+            self.results_label.clear()
         if not questions:
             QMessageBox.warning(self, "Error", "Could not generate interview questions")
             return
             
-        self.interview_window = InterviewWindow(questions, self.interview_list.currentItem().text())
+        self.interview_window = InterviewWindow(questions, self.interview_list.currentIndex().data())
         self.interview_window.interview_completed.connect(self.interview_finished)
         self.interview_window.show()
     
-    def interview_finished(self, results):
-        success = self.candidate_service.submit_interview_results(
+    @asyncSlot(dict)
+    async def interview_finished(self, results):
+        success = await self.candidate_service.submit_interview_results(
             self.selected_job_id, results
         )
         
@@ -3,7 +3,14 @@ from PyQt6.QtWidgets import (
     QPushButton, QMessageBox, QProgressBar
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from app.services.ai_service import AIService
+from dataclasses import asdict, dataclass
+
+@dataclass(slots=True)
+class AnswerRecord:
+    question: str
+    answer: str
+    correct: bool
+    difficulty: float = 1.0
 
 class InterviewWindow(QWidget):
     interview_completed = pyqtSignal(dict)  # emits results when done
@@ -94,12 +101,12 @@ class InterviewWindow(QWidget):
         if is_correct:
             self.score += 1
         
-        self.answers.append({
-            'question': question['question'],
-            'answer': question['options'][selected],
-            'correct': is_correct,
-            'difficulty': question.get('difficulty', 1.0)
-        })
+        self.answers.append(AnswerRecord(
+            question['question'],
+            question['options'][selected],
+            is_correct,
+            question.get('difficulty', 1.0)
+        ))
         
         self.current_question += 1
         self.update_progress()
@@ -110,10 +117,13 @@ class InterviewWindow(QWidget):
             self.complete_interview()
     
     def complete_interview(self):
+        # Difficulty-weighted score; a plain sum is cheapest for a handful of answers
         results = {
             'score': self.score,
             'total': len(self.questions),
-            'answers': self.answers
+            'weighted_score': float(sum(a.difficulty for a in self.answers if a.correct)),
+            'weighted_total': float(sum(a.difficulty for a in self.answers)),
+            'answers': [asdict(answer) for answer in self.answers]
         }
         self.interview_completed.emit(results)
         self.close()
\ No newline at end of file
@@ -0,0 +1,90 @@
+from typing import Callable, Dict, List, Optional
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor, QPalette
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+# Answers with every role a row sets, as {role: value}, so a delegate can
+# style an item from one data() call instead of one per role
+MULTIPLE_ROLES = Qt.ItemDataRole.UserRole + 1
+
+class RecordListModel(QAbstractListModel):
+    """
+    List model over plain dicts for a QListView. The view asks for text only
+    for rows it paints, and the full record is available under UserRole.
+    """
+    
+    def __init__(
+        self,
+        display: Callable[[dict], str],
+        parent=None,
+        foreground: Optional[Callable[[dict], Optional[QColor]]] = None
+    ):
+        """
+        Args:
+            display: Builds a row's label from its record
+            foreground: Optionally picks a row's text colour from its record
+        """
+        super().__init__(parent)
+        self._display = display
+        self._foreground = foreground
+        self._rows: List[dict] = []
+        self._roles: Dict[int, dict] = {}
+    
+    def set_rows(self, rows: List[dict]):
+        """Replace every row with one model reset"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._roles.clear()
+        self.endResetModel()
+    
+    def record(self, index: QModelIndex) -> Optional[dict]:
+        """The record behind an index, or None for an invalid index"""
+        return self._rows[index.row()] if index.isValid() else None
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(self._rows[index.row()])
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()]
+        if role == Qt.ItemDataRole.ForegroundRole and self._foreground:
+            return self._row_roles(index.row()).get(Qt.ItemDataRole.ForegroundRole)
+        if role == MULTIPLE_ROLES:
+            return self._row_roles(index.row())
+        return None
+    
+    def _row_roles(self, row: int) -> dict:
+        """Every role for a row, built on first paint and kept until the next reset"""
+        roles = self._roles.get(row)
+        if roles is None:
+            record = self._rows[row]
+            roles = {Qt.ItemDataRole.DisplayRole: self._display(record)}
+            color = self._foreground(record) if self._foreground else None
+            if color is not None:
+                roles[Qt.ItemDataRole.ForegroundRole] = QBrush(color)
+            self._roles[row] = roles
+        return roles
+
+class RecordDelegate(QStyledItemDelegate):
+    """
+    Styles items from the model's MULTIPLE_ROLES answer. The stock delegate
+    asks the model for each role separately on every paint; this asks once.
+    """
+    
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        roles = index.data(MULTIPLE_ROLES)
+        if roles is None:
+            super().initStyleOption(option, index)
+            return
+        option.index = index
+        text = roles.get(Qt.ItemDataRole.DisplayRole)
+        if text is not None:
+            option.text = text
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+        brush = roles.get(Qt.ItemDataRole.ForegroundRole)
+        if brush is not None:
+            option.palette.setBrush(QPalette.ColorRole.Text, brush)
@@ -2,7 +2,7 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QStackedWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from app.ui.candidate_dashboard import CandidateDashboard
 from app.ui.recruiter_dashboard import RecruiterDashboard
 from app.ui.admin_dashboard import AdminDashboard
@@ -61,6 +61,14 @@ class MainWindow(QMainWindow):
         return sidebar
     
     def init_dashboard(self):
+        # Paint the window around an empty page first; the dashboard, whose
+        # construction starts its data loads, is built on the next loop turn
+        placeholder = QWidget()
+        self.stacked_widget.addWidget(placeholder)
+        self.stacked_widget.setCurrentWidget(placeholder)
+        QTimer.singleShot(0, self._build_real_dashboard)
+    
+    def _build_real_dashboard(self):
         if self.role == "candidate":
             self.dashboard = CandidateDashboard(self.email)
         elif self.role == "recruiter":
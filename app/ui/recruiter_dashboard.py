@@ -1,18 +1,47 @@
+import asyncio
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QListWidget, 
+    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QTextEdit, QPushButton, QLabel, QLineEdit, QFileDialog,
-    QMessageBox, QComboBox, QSpinBox, QTextBrowser
+    QMessageBox, QComboBox, QSpinBox, QTextBrowser, QListView
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QColor, QTextCursor
+from qasync import asyncSlot
+from app.database.session import db_session
 from app.services.recruiter_service import RecruiterService
-from app.services.ai_service import AIService
+from app.services.ai_service import get_ai_service
+from app.ui.list_model import RecordListModel, RecordDelegate
+
+# Candidate details pane, filled with str.format_map
+_CANDIDATE_DETAILS_HTML = """
+        <h2>{name}</h2>
+        <p><b>Email:</b> {email}</p>
+        <p><b>Match Score:</b> {match_score}%</p>
+        <h3>Resume Summary:</h3>
+        <p>{resume_summary}</p>
+        """
+
+async def _run_service_call(func, *args):
+    """
+    Run a blocking RecruiterService call on a worker thread.
+
+    db_session is thread-local, so the worker's session is removed once the
+    call returns; otherwise each pool thread would keep an open transaction,
+    a checked-out connection and a stale identity map between calls.
+    """
+    def call():
+        try:
+            return func(*args)
+        finally:
+            db_session.remove()
+    return await asyncio.to_thread(call)
 
 class RecruiterDashboard(QWidget):
     def __init__(self, email: str):
         super().__init__()
         self.email = email
         self.recruiter_service = RecruiterService(email)
-        self.ai_service = AIService()
+        self.ai_service = get_ai_service()
         self.current_job_id = None
         self.init_ui()
         
@@ -40,6 +69,17 @@ class RecruiterDashboard(QWidget):
         
         layout.addWidget(self.tabs)
         self.setLayout(layout)
+        
+        # Each tab fetches its data when first opened, not all at construction
+        self._tab_loaders = {self.review_tab: self.load_jobs_for_review}
+        self.tabs.currentChanged.connect(self._lazy_load_tab)
+        self._lazy_load_tab(self.tabs.currentIndex())
+    
+    def _lazy_load_tab(self, index: int):
+        """Run a tab's initial load the first time it is shown"""
+        loader = self._tab_loaders.pop(self.tabs.widget(index), None)
+        if loader:
+            loader()
     
     def init_post_job_tab(self):
         layout = QVBoxLayout()
@@ -69,6 +109,14 @@ class RecruiterDashboard(QWidget):
         self.skills.setMaximumHeight(100)
         skills_layout.addWidget(self.skills)
         
+        # Skills are parsed once typing pauses, not on every button click
+        self._skills_cached = []
+        self._skills_timer = QTimer(self)
+        self._skills_timer.setSingleShot(True)
+        self._skills_timer.setInterval(200)
+        self._skills_timer.timeout.connect(self._reparse_skills)
+        self.skills.textChanged.connect(self._skills_timer.start)
+        
         # Salary Range
         salary_layout = QHBoxLayout()
         salary_layout.addWidget(QLabel("Salary Range:"))
@@ -109,6 +157,16 @@ class RecruiterDashboard(QWidget):
         
         self.post_job_tab.setLayout(layout)
     
+    def _reparse_skills(self):
+        self._skills_timer.stop()
+        self._skills_cached = [s.strip() for s in self.skills.toPlainText().split('\n') if s.strip()]
+    
+    def _current_skills(self) -> list:
+        """Parsed skills, flushing an edit still inside the debounce window"""
+        if self._skills_timer.isActive():
+            self._reparse_skills()
+        return self._skills_cached
+    
     def init_review_tab(self):
         layout = QVBoxLayout()
         
@@ -116,11 +174,19 @@ class RecruiterDashboard(QWidget):
         job_select_layout = QHBoxLayout()
         job_select_layout.addWidget(QLabel("Select Job:"))
         self.job_combo = QComboBox()
+        self.job_combo.currentIndexChanged.connect(self.load_candidates)
         job_select_layout.addWidget(self.job_combo, stretch=1)
         
         # Candidate list
-        self.candidate_list = QListWidget()
-        self.candidate_list.itemClicked.connect(self.show_candidate_details)
+        self.candidate_model = RecordListModel(
+            lambda candidate: candidate['email'], self,
+            foreground=self._match_score_color
+        )
+        self.candidate_list = QListView()
+        self.candidate_list.setUniformItemSizes(True)
+        self.candidate_list.setItemDelegate(RecordDelegate(self.candidate_list))
+        self.candidate_list.setModel(self.candidate_model)
+        self.candidate_list.clicked.connect(self.show_candidate_details)
         
         # Candidate details
         self.candidate_details = QTextBrowser()
@@ -149,44 +215,71 @@ class RecruiterDashboard(QWidget):
         layout.addLayout(button_layout)
         
         self.review_tab.setLayout(layout)
-        
-        # Load jobs
-        self.load_jobs_for_review()
     
     def init_ats_tab(self):
         # Similar implementation for ATS tab
         pass
     
-    def load_jobs_for_review(self):
-        jobs = self.recruiter_service.get_my_jobs()
-        self.job_combo.clear()
-        for job in jobs:
-            self.job_combo.addItem(job['title'], job['id'])
+    # RecruiterService runs blocking SQLAlchemy queries (and SMTP/AI calls),
+    # so every call goes through _run_service_call to keep the UI responsive
     
-    def generate_job_description(self):
+    @asyncSlot()
+    async def load_jobs_for_review(self):
+        jobs = await _run_service_call(self.recruiter_service.get_my_jobs)
+        # Without this, clear() and the first addItem each fire
+        # currentIndexChanged and reload candidates for a half-built list
+        self.job_combo.setUpdatesEnabled(False)
+        self.job_combo.blockSignals(True)
+        try:
+            self.job_combo.clear()
+            for job in jobs:
+                self.job_combo.addItem(job['title'], job['id'])
+        finally:
+            self.job_combo.blockSignals(False)
+            self.job_combo.setUpdatesEnabled(True)
+        self.load_candidates()
+    
+    @asyncSlot()
+    async def load_candidates(self):
+        job_id = self.job_combo.currentData()
+        self.candidate_model.set_rows([])
+        self.candidate_details.clear()
+        if job_id is None:
+            return
+        
+        # Details are shown from the model's records, without another query
+        candidates = await _run_service_call(self.recruiter_service.get_job_candidates, job_id)
+        self.candidate_model.set_rows(candidates)
+    
+    @asyncSlot()
+    async def generate_job_description(self):
         job_title = self.job_title.text().strip()
         department = self.department.text().strip()
-        skills = self.skills.toPlainText().strip().split('\n')
+        skills = self._current_skills()
         
         if not job_title or not department or not skills:
             QMessageBox.warning(self, "Warning", "Please fill in job title, department, and skills")
             return
         
+        # Show the description as it is generated rather than after the last word
+        self.job_desc.clear()
         try:
-            description = self.ai_service.generate_job_description(
+            async for chunk in self.ai_service.generate_job_description_stream(
                 job_title, department, skills
-            )
-            self.job_desc.setPlainText(description)
+            ):
+                self.job_desc.moveCursor(QTextCursor.MoveOperation.End)
+                self.job_desc.insertPlainText(chunk)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate description: {str(e)}")
     
-    def post_job(self):
+    @asyncSlot()
+    async def post_job(self):
         job_data = {
             'title': self.job_title.text().strip(),
             'department': self.department.text().strip(),
             'location': self.location.text().strip(),
             'description': self.job_desc.toPlainText().strip(),
-            'skills': [s.strip() for s in self.skills.toPlainText().strip().split('\n') if s.strip()],
+            'skills': self._current_skills(),
             'salary_min': self.salary_min.value(),
             'salary_max': self.salary_max.value()
         }
@@ -199,7 +292,7 @@ class RecruiterDashboard(QWidget):
             QMessageBox.warning(self, "Warning", "Minimum salary cannot be greater than maximum")
             return
         
-        success, message = self.recruiter_service.post_job(job_data)
+        success, message = await _run_service_call(self.recruiter_service.post_job, job_data)
         if success:
             QMessageBox.information(self, "Success", "Job posted successfully!")
             self.clear_job_form()
@@ -215,65 +308,85 @@ class RecruiterDashboard(QWidget):
         self.salary_max.setValue(100000)
         self.job_desc.clear()
     
-    def show_candidate_details(self, item):
-        job_id = self.job_combo.currentData()
-        candidate_email = item.text()
-        
-        candidate = self.recruiter_service.get_candidate_details(job_id, candidate_email)
+    @staticmethod
+    def _match_score_color(candidate: dict):
+        """Green for strong matches, red for weak ones, default otherwise"""
+        score = candidate.get('match_score') or 0
+        if score >= 75:
+            return QColor("darkgreen")
+        if score < 40:
+            return QColor("darkred")
+        return None
+    
+    def show_candidate_details(self, index):
+        candidate = self.candidate_model.record(index)
         if not candidate:
             return
         
-        details = f"""
-        <h2>{candidate['name']}</h2>
-        <p><b>Email:</b> {candidate['email']}</p>
-        <p><b>Match Score:</b> {candidate['match_score']}%</p>
-        <h3>Resume Summary:</h3>
-        <p>{candidate['resume_summary']}</p>
-        """
-        self.candidate_details.setHtml(details)
+        self.candidate_details.setHtml(_CANDIDATE_DETAILS_HTML.format_map(candidate))
     
-    def accept_candidate(self):
+    @asyncSlot()
+    async def accept_candidate(self):
         job_id = self.job_combo.currentData()
-        candidate_item = self.candidate_list.currentItem()
+        candidate = self.candidate_model.record(self.candidate_list.currentIndex())
         
-        if not candidate_item:
+        if not candidate:
             return
             
-        candidate_email = candidate_item.text()
-        success = self.recruiter_service.accept_candidate(job_id, candidate_email)
+        candidate_email = candidate['email']
+        success = await _run_service_call(
+            self.recruiter_service.accept_candidate, job_id, candidate_email
+        )
         
         if success:
             QMessageBox.information(self, "Success", "Candidate accepted and notified")
         else:
             QMessageBox.critical(self, "Error", "Failed to accept candidate")
     
-    def reject_candidate(self):
+    @asyncSlot()
+    async def reject_candidate(self):
         job_id = self.job_combo.currentData()
-        candidate_item = self.candidate_list.currentItem()
+        candidate = self.candidate_model.record(self.candidate_list.currentIndex())
         
-        if not candidate_item:
+        if not candidate:
             return
             
-        candidate_email = candidate_item.text()
-        success = self.recruiter_service.reject_candidate(job_id, candidate_email)
+        candidate_email = candidate['email']
+        success = await _run_service_call(
+            self.recruiter_service.reject_candidate, job_id, candidate_email
+        )
         
         if success:
             QMessageBox.information(self, "Success", "Candidate rejected and notified")
         else:
             QMessageBox.critical(self, "Error", "Failed to reject candidate")
     
-    def generate_ai_summary(self):
+    @asyncSlot()
+    async def generate_ai_summary(self):
         job_id = self.job_combo.currentData()
-        candidate_item = self.candidate_list.currentItem()
+        candidate = self.candidate_model.record(self.candidate_list.currentIndex())
         
-        if not candidate_item:
+        if not candidate:
             return
             
-        candidate_email = candidate_item.text()
+        candidate_email = candidate['email']
         
         try:
-            summary = self.recruiter_service.generate_ai_summary(job_id, candidate_email)
-            self.candidate_details.append("\n\n<b>AI Analysis:</b>")
-            self.candidate_details.append(summary)
+            self.ai_summary_btn.setEnabled(False)
+            summary = await _run_service_call(
+                self.recruiter_service.generate_ai_summary, job_id, candidate_email
+            )
+            # One insertion at the end, without re-flowing what is already shown
+            cursor = self.candidate_details.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            self.candidate_details.setUpdatesEnabled(False)
+            try:
+                cursor.insertHtml("<br><br><b>AI Analysis:</b><br>")
+                cursor.insertText(summary)
+            finally:
+                self.candidate_details.setUpdatesEnabled(True)
+            self.candidate_details.setTextCursor(cursor)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate AI summary: {str(e)}")
+        finally:
+            self.ai_summary_btn.setEnabled(True)
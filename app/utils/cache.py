@@ -0,0 +1,58 @@
+"""
+In-process TTL cache for expensive async computations
+
+Concurrent callers asking for the same missing key share a single
+computation instead of each running it (single-flight).
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+class AsyncTTLCache:
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Args:
+            ttl: Seconds a computed value stays fresh
+            maxsize: Maximum number of cached keys (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_compute(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the cached value for key, computing it with factory on a miss.
+        Failures are not cached; every waiter receives the exception.
+        """
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(factory())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda future: self._store(key, future))
+        # Shield so one caller being cancelled does not cancel the shared work
+        return await asyncio.shield(pending)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or everything when key is None"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _store(self, key: Hashable, future: asyncio.Future):
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, future.result())
@@ -1,5 +1,6 @@
 import os
 import logging
+from functools import lru_cache
 from typing import Optional, List
 from pydantic import BaseModel, EmailStr, AnyUrl, field_validator
 from pydantic_settings import BaseSettings
@@ -7,9 +8,6 @@ from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
-
 
 class Settings(BaseSettings):
     # Application Config
@@ -22,8 +20,15 @@ class Settings(BaseSettings):
     DATABASE_URL: str  # ✅ Added to match .env
     MONGO_URI: str
     MONGO_DB_NAME: str = "recruitment_db"
-    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MAX_POOL_SIZE: int = 50
+    MONGO_MIN_POOL_SIZE: int = 10
+    MONGO_MAX_IDLE_TIME_MS: int = 300000
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGO_HEARTBEAT_FREQUENCY_MS: int = 10000
+    MONGO_COMPRESSORS: str = "zstd,snappy,zlib"
+    MONGO_LOG_POOL_EVENTS: bool = False
     MONGO_TIMEOUT_MS: int = 5000
+    MONGO_CONNECT_ATTEMPTS: int = 5
 
     # AWS Configuration
     AWS_ACCESS_KEY_ID: str
@@ -46,17 +51,36 @@ class Settings(BaseSettings):
     HF_API_TOKEN: Optional[str] = None
     HF_MODEL: Optional[str] = None
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    SPACY_MODEL: str = "en_core_web_sm"
+    USE_GPU: bool = False
+    TORCH_NUM_THREADS: Optional[int] = None  # CPU inference threads; unset keeps torch's default (physical cores)
+    USE_ONNX: bool = False  # Run embeddings through ONNX Runtime with INT8 weights (needs requirements-onnx.txt)
+    ONNX_QUANTIZATION: str = "avx512_vnni"  # arm64, avx2, avx512 or avx512_vnni
+    ONNX_MODEL_DIR: str = "data/onnx_models"
+    EMBEDDING_CACHE_SIZE: int = 100
+    EMBEDDING_CACHE_TTL: int = 3600  # 1 hour
+    EMBEDDING_CACHE_DIR: str = "data/embedding_cache"
 
     # Security Configuration
     SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"  # ✅ Added to match .env
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     PASSWORD_RESET_TIMEOUT: int = 3600  # 1 hour
+    ARGON2_TIME_COST: int = 3  # passes over memory; tune so one hash takes ~250 ms on the host
+    ARGON2_MEMORY_COST: int = 65536  # KiB per hash
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_MIN_HASH_MS: int = 100  # refuse to start if hashing is faster; 0 disables
 
     # File Uploads
     MAX_FILE_SIZE_MB: int = 10
     ALLOWED_FILE_TYPES: List[str] = ["pdf", "docx", "png", "jpg", "jpeg"]
 
+    # Admin Dashboard
+    ADMIN_CACHE_TTL_SECONDS: int = 15
+
+    # Job listings shown on the candidate and recruiter dashboards
+    JOB_LIST_CACHE_TTL_SECONDS: int = 30
+
     # OCR Configuration
     TESSERACT_PATH: Optional[str] = None
 
@@ -110,13 +134,28 @@ def validate_config():
         raise RuntimeError("\n".join(errors))
 
 
-try:
-    # Validate configuration on import
-    validate_config()
-    settings = Settings()
-    logger.info("Configuration loaded successfully")
-except Exception as e:
-    logger.critical(f"Configuration validation failed: {str(e)}")
-    raise
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Validate and load configuration once, on first use rather than on import"""
+    try:
+        # Load environment variables from .env file
+        load_dotenv()
+        validate_config()
+        loaded = Settings()
+        logger.info("Configuration loaded successfully")
+        return loaded
+    except Exception as e:
+        logger.critical(f"Configuration validation failed: {str(e)}")
+        raise
+
+
+class _LazySettings:
+    """Stands in for the Settings instance and loads it on first attribute access"""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+
+settings = _LazySettings()
 
-__all__ = ["settings"]
+__all__ = ["settings", "get_settings"]
@@ -0,0 +1,92 @@
+"""
+Persistent embedding cache
+
+Stores embedding vectors in a local SQLite database (WAL mode) keyed by a
+content hash, so embeddings survive restarts and are only computed once
+per model and text.
+"""
+
+import os
+import sqlite3
+import threading
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class EmbeddingDiskCache:
+    def __init__(self, directory: str, dtype=np.float32):
+        """
+        Args:
+            directory: Directory holding the cache database (created if missing)
+            dtype: Element type vectors are stored and returned as
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.dtype = np.dtype(dtype)
+        # One table per element type so changing dtype never misreads old rows
+        self._table = f"embeddings_{self.dtype.name}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "embeddings.sqlite3"),
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """Return the stored vector for key, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT vector FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+        return np.frombuffer(row[0], dtype=self.dtype) if row else None
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Return the stored vectors for whichever keys are present"""
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM {self._table} WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                found.update((key, np.frombuffer(vector, dtype=self.dtype)) for key, vector in rows)
+        return found
+
+    def put(self, key: bytes, vector: np.ndarray):
+        """Store a vector under key, replacing any previous value"""
+        data = np.asarray(vector, dtype=self.dtype).tobytes()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self._table} (key, vector) VALUES (?, ?)",
+                    (key, data)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # A failed cache write only costs a recomputation later
+            logger.warning(f"Failed to persist embedding: {str(e)}")
+
+    def put_many(self, items: Iterable[Tuple[bytes, np.ndarray]]):
+        """Store several vectors in one transaction"""
+        rows = [(key, np.asarray(vector, dtype=self.dtype).tobytes()) for key, vector in items]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self._table} (key, vector) VALUES (?, ?)",
+                    rows
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist {len(rows)} embeddings: {str(e)}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,45 @@
 import os
 import re
+import csv
+import asyncio
+import hashlib
+import shutil
 import logging
-from tempfile import NamedTemporaryFile
+import threading
+import subprocess
+import importlib.util
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
 from typing import Optional, Dict, List
-from pathlib import Path
+from cachetools import LRUCache
 from PyPDF2 import PdfReader
 from docx import Document
 import pptx
 import openpyxl  # For Excel files
 import pytesseract
 from PIL import Image, UnidentifiedImageError
-import pandas as pd  # For CSV and Excel
-import pdfplumber  # Alternative PDF parser
+import pdfplumber  # Fallback PDF parser
 from app.utils.config import settings
+from app.utils.pdf_text import extract_pdf_text, pdf_page_count
+from app.utils.ocr import ocr_image
 from fastapi import HTTPException, UploadFile
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Image modes Tesseract takes as they are; anything else (CMYK, palette,
+# 16-bit) is converted to RGB first
+_OCR_NATIVE_MODES = frozenset({'1', 'L', 'RGB', 'RGBA'})
+OCR_CACHE_SIZE = 4096
+
+# OCR results keyed by a BLAKE2b digest of the image bytes, so re-uploads
+# of the same image skip Tesseract
+_ocr_cache = LRUCache(maxsize=OCR_CACHE_SIZE)
+_ocr_cache_lock = threading.Lock()
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# C0 and C1 control characters, deleted with str.translate
+_CONTROL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+
 class FileParser:
     def __init__(self):
         """Initialize the file parser with OCR configuration"""
@@ -34,6 +57,9 @@ class FileParser:
             '.jpeg': self._parse_image,
         }
         self.max_file_size = settings.MAX_FILE_SIZE_MB * 1024 * 1024  # Convert MB to bytes
+        # Legacy .doc converters don't change while the app runs; look them up once
+        self._antiword_path = shutil.which("antiword")
+        self._textract_available = importlib.util.find_spec("textract") is not None
 
     def _configure_ocr(self):
         """Configure Tesseract OCR path if specified"""
@@ -64,7 +90,7 @@ class FileParser:
             self._validate_file(file)
             
             # Get file extension
-            file_ext = Path(file.filename).suffix.lower()
+            file_ext = os.path.splitext(file.filename)[1].lower()
             
             if file_ext not in self.supported_formats:
                 raise HTTPException(
@@ -72,16 +98,33 @@ class FileParser:
                     detail=f"Unsupported file format: {file_ext}"
                 )
             
-            # Use temp file for parsing
+            # Stream the upload to a temp file in 1 MB chunks rather than
+            # holding it all in memory, rejecting it once it passes the limit.
+            # Uploads already spooled to disk are copied by the kernel instead
             with NamedTemporaryFile(delete=False) as temp_file:
-                content = await file.read()
-                temp_file.write(content)
                 temp_path = temp_file.name
+                try:
+                    size = await asyncio.to_thread(
+                        self._sendfile_upload, file, temp_file.fileno()
+                    )
+                    if size is None:
+                        temp_file.seek(0)
+                        size = 0
+                        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                            size += len(chunk)
+                            if size > self.max_file_size:
+                                raise self._file_too_large()
+                            temp_file.write(chunk)
+                except BaseException:
+                    temp_file.close()
+                    os.unlink(temp_path)
+                    raise
             
             try:
-                # Parse the file
+                # Parsers block on disk and C libraries; run them off the
+                # event loop so one slow file doesn't stall everything else
                 parse_func = self.supported_formats[file_ext]
-                result = parse_func(temp_path)
+                result = await asyncio.to_thread(parse_func, temp_path)
                 
                 # Clean up temp file
                 os.unlink(temp_path)
@@ -91,7 +134,7 @@ class FileParser:
                     'metadata': {
                         **result['metadata'],
                         'file_name': file.filename,
-                        'file_size': len(content),
+                        'file_size': size,
                         'file_type': file_ext[1:].upper()  # Remove dot
                     }
                 }
@@ -116,11 +159,51 @@ class FileParser:
                 detail="No filename provided"
             )
             
-        if file.size > self.max_file_size:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Max size is {settings.MAX_FILE_SIZE_MB}MB"
-            )
+        # The size may be unknown until the upload is read; parse_file
+        # enforces the limit again while streaming
+        if file.size is not None and file.size > self.max_file_size:
+            raise self._file_too_large()
+
+    def _sendfile_upload(self, file: UploadFile, dst_fd: int) -> Optional[int]:
+        """Copy a rolled-over upload into dst_fd with os.sendfile.
+
+        Returns the number of bytes copied, or None when the upload is still
+        in memory (or sendfile is unavailable) and must be streamed instead.
+        """
+        src = file.file
+        if not (
+            hasattr(os, 'sendfile')
+            and isinstance(src, SpooledTemporaryFile)
+            and getattr(src, '_rolled', False)
+        ):
+            return None
+        
+        src.flush()
+        src_fd = src.fileno()
+        size = os.fstat(src_fd).st_size
+        if size > self.max_file_size:
+            raise self._file_too_large()
+        
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+        except OSError as e:
+            # Some filesystems reject sendfile; start over on the chunked path
+            logger.debug(f"sendfile failed, streaming upload instead: {str(e)}")
+            os.ftruncate(dst_fd, 0)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            return None
+        return offset
+
+    def _file_too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"File too large. Max size is {settings.MAX_FILE_SIZE_MB}MB"
+        )
 
     def _parse_pdf(self, file_path: str) -> Dict[str, str]:
         """Parse text from PDF file using multiple methods"""
@@ -128,23 +211,18 @@ class FileParser:
         metadata = {}
         
         try:
-            # First try with pdfplumber for better text extraction
-            with pdfplumber.open(file_path) as pdf:
-                content = "\n".join(
-                    page.extract_text() or "" 
-                    for page in pdf.pages
-                )
-                metadata['page_count'] = len(pdf.pages)
+            # PDFium extracts in C, orders of magnitude faster than
+            # pdfminer; it falls back to PyPDF2 for files it can't open
+            content = extract_pdf_text(file_path)
+            metadata['page_count'] = pdf_page_count(file_path)
                 
-            # Fallback to PyPDF2 if no text extracted
+            # Fallback to pdfplumber if no text extracted
             if not content.strip():
-                with open(file_path, 'rb') as f:
-                    reader = PdfReader(f)
+                with pdfplumber.open(file_path) as pdf:
                     content = "\n".join(
                         page.extract_text() or "" 
-                        for page in reader.pages
+                        for page in pdf.pages
                     )
-                    metadata['page_count'] = len(reader.pages)
                     
         except Exception as e:
             logger.warning(f"PDF parsing error: {str(e)}")
@@ -191,10 +269,9 @@ class FileParser:
         """Parse text from legacy DOC format (requires antiword)"""
         try:
             # Try using antiword if available
-            if os.system("which antiword > /dev/null") == 0:
-                import subprocess
+            if self._antiword_path:
                 result = subprocess.run(
-                    ["antiword", file_path],
+                    [self._antiword_path, file_path],
                     capture_output=True,
                     text=True
                 )
@@ -205,15 +282,13 @@ class FileParser:
                     }
             
             # Fallback to textract if installed
-            try:
+            if self._textract_available:
                 import textract
                 content = textract.process(file_path).decode('utf-8')
                 return {
                     'content': content,
                     'metadata': {'format': 'DOC'}
                 }
-            except ImportError:
-                pass
                 
             raise HTTPException(
                 status_code=400,
@@ -253,19 +328,29 @@ class FileParser:
     def _parse_excel(self, file_path: str) -> Dict[str, str]:
         """Parse text from Excel files"""
         try:
-            # Read all sheets
-            excel_data = pd.read_excel(file_path, sheet_name=None)
+            # Stream rows straight out of the workbook; building DataFrames
+            # only to print them back out costs far more than the text is worth
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
             content = []
+            columns = []
             
-            for sheet_name, df in excel_data.items():
-                content.append(f"=== Sheet: {sheet_name} ===")
-                content.append(df.to_string())
+            try:
+                for index, sheet in enumerate(workbook.worksheets):
+                    content.append(f"=== Sheet: {sheet.title} ===")
+                    for row in sheet.iter_rows(values_only=True):
+                        cells = ['' if value is None else str(value) for value in row]
+                        if index == 0 and not columns:
+                            columns = cells
+                        content.append('\t'.join(cells))
+                sheet_count = len(workbook.worksheets)
+            finally:
+                workbook.close()
             
             return {
                 'content': "\n".join(content),
                 'metadata': {
-                    'sheet_count': len(excel_data),
-                    'columns': list(excel_data.values())[0].columns.tolist() if excel_data else []
+                    'sheet_count': sheet_count,
+                    'columns': columns
                 }
             }
         except Exception as e:
@@ -278,12 +363,18 @@ class FileParser:
     def _parse_csv(self, file_path: str) -> Dict[str, str]:
         """Parse text from CSV files"""
         try:
-            df = pd.read_csv(file_path)
+            # Stream rows as tab-separated text; no DataFrame or dtype inference
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                columns = next(reader, [])
+                rows = ['\t'.join(columns)]
+                rows.extend('\t'.join(row) for row in reader)
+            
             return {
-                'content': df.to_string(),
+                'content': "\n".join(rows),
                 'metadata': {
-                    'row_count': len(df),
-                    'columns': df.columns.tolist()
+                    'row_count': len(rows) - 1,
+                    'columns': columns
                 }
             }
         except Exception as e:
@@ -315,19 +406,34 @@ class FileParser:
     def _parse_image(self, file_path: str) -> Dict[str, str]:
         """Parse text from images using OCR"""
         try:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(file_path, 'rb') as f:
+                while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+            key = digest.hexdigest()
+            with _ocr_cache_lock:
+                cached = _ocr_cache.get(key)
+            if cached is not None:
+                return {'content': cached['content'], 'metadata': dict(cached['metadata'])}
+            
             image = Image.open(file_path)
             
-            # Preprocess image for better OCR results
-            image = image.convert('L')  # Convert to grayscale
-            content = pytesseract.image_to_string(image)
+            # Tesseract binarises the image itself, so a grayscale copy
+            # only costs a full pass and another buffer
+            if image.mode not in _OCR_NATIVE_MODES:
+                image = image.convert('RGB')
+            content = ocr_image(image)
             
-            return {
+            result = {
                 'content': content,
                 'metadata': {
                     'dimensions': f"{image.width}x{image.height}",
                     'mode': image.mode
                 }
             }
+            with _ocr_cache_lock:
+                _ocr_cache[key] = result
+            return {'content': content, 'metadata': dict(result['metadata'])}
         except UnidentifiedImageError:
             raise HTTPException(
                 status_code=400,
@@ -344,14 +450,21 @@ class FileParser:
         """Clean and normalize extracted text"""
         if not text:
             return ""
+        
+        # Printable text has no whitespace but plain spaces and no control
+        # characters, so without double spaces there is nothing to rewrite
+        if text.isprintable() and '  ' not in text:
+            return text.strip()
             
-        # Remove excessive whitespace and non-printable characters
-        text = re.sub(r'\s+', ' ', text).strip()
-        text = ''.join(char for char in text if char.isprintable())
+        # Collapse whitespace (line breaks included), then drop control
+        # characters in one C-level pass
+        text = _WHITESPACE_RE.sub(' ', text).strip()
+        text = text.translate(_CONTROL_CHARS_TABLE)
         
-        # Normalize line endings and remove special characters
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        # Other non-printables (format, private-use, unassigned) are rare;
+        # isprintable() checks the whole string in C before any filtering
+        if not text.isprintable():
+            text = ''.join(filter(str.isprintable, text))
         
         return text
 
@@ -362,7 +475,7 @@ class FileParser:
     async def extract_metadata(self, file: UploadFile) -> Dict:
         """Extract basic metadata from file without full parsing"""
         try:
-            file_ext = Path(file.filename).suffix.lower()
+            file_ext = os.path.splitext(file.filename)[1].lower()
             
             if file_ext == '.pdf':
                 with open(file.filename, 'rb') as f:
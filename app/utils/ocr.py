@@ -0,0 +1,41 @@
+"""
+Tesseract OCR, in-process through tesserocr when it is installed
+
+tesserocr binds the C++ API directly: the recognition model stays loaded
+between images and the GIL is released while recognising, so OCR threads
+run in parallel. Without it, pytesseract starts the tesseract binary and
+writes a temp file for every image. Install it with requirements-ocr.txt.
+"""
+
+import threading
+from typing import Dict
+from PIL import Image
+import pytesseract
+
+try:
+    from tesserocr import PyTessBaseAPI, OEM
+except ImportError:
+    PyTessBaseAPI = None
+
+# Tesseract page segmentation mode when none is given (fully automatic)
+DEFAULT_PSM = 3
+
+# PyTessBaseAPI instances are not thread-safe, so each thread keeps its own
+_local = threading.local()
+
+def _get_api(psm: int) -> "PyTessBaseAPI":
+    apis: Dict[int, PyTessBaseAPI] = getattr(_local, 'apis', None)
+    if apis is None:
+        apis = _local.apis = {}
+    api = apis.get(psm)
+    if api is None:
+        api = apis[psm] = PyTessBaseAPI(psm=psm, oem=OEM.LSTM_ONLY)
+    return api
+
+def ocr_image(image: Image.Image, psm: int = DEFAULT_PSM) -> str:
+    """Recognise the text in one image with Tesseract's LSTM engine"""
+    if PyTessBaseAPI is None:
+        return pytesseract.image_to_string(image, config=f"--oem 1 --psm {psm}")
+    api = _get_api(psm)
+    api.SetImage(image)
+    return api.GetUTF8Text()
@@ -0,0 +1,127 @@
+"""
+PDF text extraction
+
+Text is read through PDFium (pypdfium2), whose extraction runs in C;
+PyPDF2 is kept as a fallback for files PDFium refuses to open.
+
+Kept free of heavy imports: long documents are split across worker
+processes, and each worker only needs to import this module.
+"""
+
+import mmap
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+import pypdfium2 as pdfium
+from PIL import Image
+from PyPDF2 import PdfReader
+
+# Below this many pages the process round-trip costs more than it saves
+PARALLEL_MIN_PAGES = 64
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+# Page render resolution for OCR of scanned PDFs
+OCR_RENDER_DPI = 200
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Shared worker pool, started on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+    return _pool
+
+@contextmanager
+def _mapped(file_path: str) -> Iterator[mmap.mmap]:
+    """Read-only memory map of a file; readers parse it without copying into Python bytes"""
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _page_text(pdf: pdfium.PdfDocument, index: int) -> str:
+    page = pdf[index]
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Worker: extract pages [start, stop) with a document handle of its own"""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return [_page_text(pdf, i) for i in range(start, stop)]
+    finally:
+        pdf.close()
+
+def _extract_with_pypdf2(file_path: str) -> str:
+    """Pure-Python fallback; raises PdfReadError on unreadable files"""
+    with _mapped(file_path) as mm:
+        reader = PdfReader(mm)
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+def pdf_page_count(file_path: str) -> int:
+    """Number of pages, read from the document's page tree without parsing content"""
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+    except pdfium.PdfiumError:
+        with _mapped(file_path) as mm:
+            return len(PdfReader(mm).pages)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+def extract_pdf_images(file_path: str) -> List[Image.Image]:
+    """Every page rendered to a greyscale image, in order - for OCR of image-only PDFs"""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        images = []
+        for index in range(len(pdf)):
+            page = pdf[index]
+            try:
+                images.append(page.render(scale=OCR_RENDER_DPI / 72, grayscale=True).to_pil())
+            finally:
+                page.close()
+        return images
+    finally:
+        pdf.close()
+
+def extract_pdf_text(file_path: str) -> str:
+    """
+    Extract the text of every page, one page per line block.
+
+    Documents of PARALLEL_MIN_PAGES or more are split into contiguous page
+    ranges parsed in parallel processes; PDFium handles are not thread-safe.
+    """
+    if os.path.getsize(file_path) == 0:
+        return ""
+    
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+    except pdfium.PdfiumError:
+        return _extract_with_pypdf2(file_path)
+    
+    try:
+        page_count = len(pdf)
+        if page_count < PARALLEL_MIN_PAGES:
+            return "\n".join(_page_text(pdf, i) for i in range(page_count))
+    finally:
+        pdf.close()
+    
+    # Workers open the same file, sharing the OS page cache instead of
+    # receiving a pickled copy of it
+    pool = _get_pool()
+    workers = min(MAX_WORKERS, page_count)
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    futures = [
+        pool.submit(_extract_page_range, file_path, start, stop)
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    return "\n".join(text for future in futures for text in future.result())
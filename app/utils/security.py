@@ -1,12 +1,17 @@
 import os
 import re
+import math
+import base64
 import secrets
 import string
 import logging
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any, FrozenSet, Iterable
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from cryptography.fernet import Fernet, InvalidToken
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
@@ -14,6 +19,22 @@ from app.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
+_SCRIPT_TAG_RE = re.compile(r'<script.*?>.*?</script>', flags=re.IGNORECASE | re.DOTALL)
+_EVENT_HANDLER_RE = re.compile(r'on\w+=".*?"', flags=re.IGNORECASE)
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w.-]')
+# ASCII characters the regex above would remove, deleted with str.translate
+_FILENAME_KEEP = frozenset(string.ascii_letters + string.digits + '._-')
+_UNSAFE_FILENAME_TABLE = str.maketrans(
+    '', '', ''.join(chr(i) for i in range(128) if chr(i) not in _FILENAME_KEEP)
+)
+_TOKEN_ALPHABET = string.ascii_letters + string.digits
+
+@lru_cache(maxsize=4)
+def _get_cipher(key: str) -> Fernet:
+    """Fernet cipher for a secret, padded or cut to 32 bytes"""
+    padded = key[:32].ljust(32, '0').encode()
+    return Fernet(base64.urlsafe_b64encode(padded))
+
 # Security configurations
 class TokenData(BaseModel):
     username: Optional[str] = None
@@ -24,14 +45,14 @@ class Token(BaseModel):
     token_type: str
     expires_at: datetime
 
-# Password hashing context
+# Password hashing context. New hashes use Argon2id with the same tuning as
+# AuthService; bcrypt is only kept so existing hashes still verify
 pwd_context = CryptContext(
-    schemes=["bcrypt", "argon2"],
+    schemes=["argon2", "bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12,
-    argon2__time_cost=3,
-    argon2__memory_cost=65536,
-    argon2__parallelism=4,
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
     argon2__hash_len=32,
     argon2__salt_len=16
 )
@@ -74,6 +95,25 @@ class SecurityUtils:
         """
         return pwd_context.hash(password)
 
+    @staticmethod
+    def bulk_hash(passwords: List[str]) -> List[str]:
+        """
+        Hash many passwords at once, e.g. when seeding or migrating users
+        
+        The KDF backends release the GIL while hashing, so threads spread
+        the work over every core.
+        
+        Args:
+            passwords: The passwords to hash
+            
+        Returns:
+            List[str]: The hashes, in the same order as the passwords
+        """
+        if not passwords:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(passwords), os.cpu_count() or 1)) as executor:
+            return list(executor.map(pwd_context.hash, passwords))
+
     @staticmethod
     def generate_secure_token(length: int = 32) -> str:
         """
@@ -85,8 +125,15 @@ class SecurityUtils:
         Returns:
             str: Generated token
         """
-        alphabet = string.ascii_letters + string.digits
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        # Draw every character from one random integer (a single urandom
+        # read) rather than one secrets.choice per character
+        base = len(_TOKEN_ALPHABET)
+        value = secrets.randbelow(base ** length)
+        chars = []
+        for _ in range(length):
+            value, index = divmod(value, base)
+            chars.append(_TOKEN_ALPHABET[index])
+        return ''.join(chars)
 
     @staticmethod
     def create_access_token(
@@ -207,7 +254,7 @@ class SecurityUtils:
         Returns:
             str: Generated OTP
         """
-        return ''.join(secrets.choice(string.digits) for _ in range(length))
+        return str(secrets.randbelow(10 ** length)).zfill(length)
 
     @staticmethod
     def encrypt_data(data: str, key: Optional[str] = None) -> str:
@@ -221,13 +268,8 @@ class SecurityUtils:
         Returns:
             str: Encrypted data
         """
-        from cryptography.fernet import Fernet, InvalidToken
         try:
-            fernet_key = key or settings.SECRET_KEY
-            # Ensure the key is 32 url-safe base64-encoded bytes
-            if len(fernet_key) != 32:
-                fernet_key = fernet_key[:32].ljust(32, '0')
-            cipher_suite = Fernet(fernet_key.encode())
+            cipher_suite = _get_cipher(key or settings.SECRET_KEY)
             return cipher_suite.encrypt(data.encode()).decode()
         except InvalidToken as e:
             logger.error(f"Encryption failed: {str(e)}")
@@ -251,12 +293,8 @@ class SecurityUtils:
         Raises:
             HTTPException: If decryption fails
         """
-        from cryptography.fernet import Fernet, InvalidToken
         try:
-            fernet_key = key or settings.SECRET_KEY
-            if len(fernet_key) != 32:
-                fernet_key = fernet_key[:32].ljust(32, '0')
-            cipher_suite = Fernet(fernet_key.encode())
+            cipher_suite = _get_cipher(key or settings.SECRET_KEY)
             return cipher_suite.decrypt(encrypted_data.encode()).decode()
         except InvalidToken as e:
             logger.error(f"Decryption failed: {str(e)}")
@@ -288,8 +326,8 @@ class SecurityUtils:
         """
         if isinstance(input_data, str):
             # Remove script tags and dangerous attributes
-            input_data = re.sub(r'<script.*?>.*?</script>', '', input_data, flags=re.IGNORECASE)
-            input_data = re.sub(r'on\w+=".*?"', '', input_data)
+            input_data = _SCRIPT_TAG_RE.sub('', input_data)
+            input_data = _EVENT_HANDLER_RE.sub('', input_data)
             return input_data.strip()
         elif isinstance(input_data, dict):
             return {k: SecurityUtils.sanitize_input(v) for k, v in input_data.items()}
@@ -308,14 +346,28 @@ class SecurityUtils:
         Returns:
             Dict: Password strength analysis
         """
+        # Classify every character and count it for the entropy in one pass
+        has_upper = has_lower = has_digit = has_special = False
+        freq: Dict[str, int] = {}
+        for c in password:
+            freq[c] = freq.get(c, 0) + 1
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif not c.isalnum():
+                has_special = True
+        
         analysis = {
             "length": len(password),
-            "has_upper": any(c.isupper() for c in password),
-            "has_lower": any(c.islower() for c in password),
-            "has_digit": any(c.isdigit() for c in password),
-            "has_special": any(not c.isalnum() for c in password),
+            "has_upper": has_upper,
+            "has_lower": has_lower,
+            "has_digit": has_digit,
+            "has_special": has_special,
             "is_common": password.lower() in SecurityUtils._load_common_passwords(),
-            "entropy": SecurityUtils._calculate_entropy(password)
+            "entropy": SecurityUtils._entropy_from_counts(freq.values(), len(password))
         }
         
         # Calculate strength score (0-100)
@@ -341,29 +393,35 @@ class SecurityUtils:
         return analysis
 
     @staticmethod
-    def _load_common_passwords() -> List[str]:
-        """Load list of common passwords for checking"""
+    @lru_cache(maxsize=1)
+    def _load_common_passwords() -> FrozenSet[str]:
+        """Load the set of common passwords once per process"""
         try:
             with open("data/common_passwords.txt", "r") as f:
-                return [line.strip().lower() for line in f if line.strip()]
+                return frozenset(
+                    line for line in (raw.strip().lower() for raw in f) if line
+                )
         except FileNotFoundError:
-            return [
+            return frozenset([
                 "password", "123456", "qwerty", "letmein", 
                 "admin", "welcome", "monkey", "sunshine"
-            ]
+            ])
 
     @staticmethod
     def _calculate_entropy(password: str) -> float:
         """Calculate password entropy"""
-        import math
         from collections import Counter
         
-        if not password:
+        return SecurityUtils._entropy_from_counts(Counter(password).values(), len(password))
+
+    @staticmethod
+    def _entropy_from_counts(counts: Iterable[int], length: int) -> float:
+        """Shannon entropy in bits per character from character counts"""
+        if not length:
             return 0.0
             
-        freq = Counter(password)
-        prob = [float(v) / len(password) for v in freq.values()]
-        return -sum(p * math.log(p, 2) for p in prob)
+        prob = [float(v) / length for v in counts]
+        return -sum(p * math.log2(p) for p in prob)
 
     @staticmethod
     def generate_secure_filename(original_filename: str) -> str:
@@ -376,8 +434,12 @@ class SecurityUtils:
         Returns:
             str: Sanitized filename
         """
-        # Keep only alphanumeric, dots, underscores and hyphens
-        filename = re.sub(r'[^\w.-]', '', original_filename)
+        # Keep only alphanumeric, dots, underscores and hyphens; non-ASCII
+        # names need the regex so Unicode letters are kept too
+        if original_filename.isascii():
+            filename = original_filename.translate(_UNSAFE_FILENAME_TABLE)
+        else:
+            filename = _UNSAFE_FILENAME_CHARS_RE.sub('', original_filename)
         # Remove leading/trailing dots and spaces
         filename = filename.strip('. ')
         # Add random suffix to prevent guessing
@@ -0,0 +1,54 @@
+"""
+One-shot migration: add the `category` field to existing activity logs
+
+Activity statistics group on `category` instead of matching the action
+text. Documents written before the field existed are classified from
+their action text. Run once from the project root:
+
+    python -m scripts.backfill_activity_categories
+"""
+
+import logging
+import sys
+from app.database.mongo import sync_mongodb
+
+logger = logging.getLogger(__name__)
+
+# Anchored, case-sensitive prefixes of the action texts AdminService has
+# written; first match wins and anything unmatched is an admin action
+CATEGORY_PREFIXES = [
+    ("^Set user ", "user"),
+    ("^Approved job:", "job"),
+    ("^User", "user"),
+    ("^Job", "job"),
+    ("^Application", "application"),
+]
+
+def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    try:
+        with sync_mongodb() as db:
+            result = db.activity_logs.update_many(
+                {"category": {"$exists": False}},
+                [{"$set": {"category": {"$switch": {
+                    "branches": [
+                        {
+                            "case": {"$regexMatch": {"input": "$action", "regex": prefix}},
+                            "then": category
+                        }
+                        for prefix, category in CATEGORY_PREFIXES
+                    ],
+                    "default": "admin"
+                }}}}]
+            )
+        logger.info(f"Backfilled category on {result.modified_count} activity logs")
+        return 0
+    except Exception as e:
+        logger.critical(f"Activity log backfill failed: {str(e)}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+One-shot MongoDB index migration
+
+Index creation is not part of application start-up. Run this once per
+deployment (and whenever MongoDB.INDEXES changes) from the project root:
+
+    python -m scripts.create_indexes
+"""
+
+import logging
+import sys
+from app.database.mongo import MongoDB, sync_mongodb
+
+logger = logging.getLogger(__name__)
+
+def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    try:
+        with sync_mongodb() as db:
+            MongoDB.ensure_indexes(db)
+        logger.info("MongoDB indexes created successfully")
+        return 0
+    except Exception as e:
+        logger.critical(f"Index creation failed: {str(e)}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
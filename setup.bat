@@ -29,4 +29,5 @@ pip install --upgrade pip
 pip install -r requirements.txt
 
 echo Setup completed successfully!
+echo Once MongoDB is reachable, create indexes with: python -m scripts.create_indexes
 pause
\ No newline at end of file